@@ -1,5 +1,6 @@
 """Configuration management for Voice2Suno application."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
@@ -8,34 +9,77 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Environment variables that feed Config. The parsed result is memoized on
+# a snapshot of these, so repeated Config() calls are a dict hit instead of
+# re-reading the environment and re-stating directories - and a patched
+# environment (as in tests) snapshots differently, producing a fresh entry.
+_WATCHED_ENV = (
+    "SUNO_COOKIE",
+    "SUNO_MODEL_VERSION",
+    "OUTPUT_DIR",
+    "DOWNLOADS_DIR",
+    "DEBUG",
+    "WAIT_AUDIO",
+)
+
+# Directories this process has already created; repeat instantiations skip
+# the mkdir syscalls entirely
+_realized_dirs: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process; later calls are a set lookup."""
+    key = str(path)
+    if key not in _realized_dirs:
+        # A stat is cheaper than the mkdir walk when the directory (the
+        # common case after the first run) already exists
+        if not path.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
+        _realized_dirs.add(key)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_config(env_snapshot: tuple) -> "Config":
+    """Build (and cache) the Config for one environment snapshot."""
+    cfg = object.__new__(Config)
+    cfg._load()
+    return cfg
+
 
 class Config:
-    """Configuration class for Voice2Suno application."""
-    
-    def __init__(self):
+    """Configuration class for Voice2Suno application.
+
+    Construction is memoized: two Config() calls under the same
+    environment return the same parsed instance.
+    """
+
+    def __new__(cls) -> "Config":
+        return _build_config(tuple(os.environ.get(k) for k in _WATCHED_ENV))
+
+    def _load(self) -> None:
         """Initialize configuration with environment variables and defaults."""
         # Suno AI Configuration
         self.suno_cookie: Optional[str] = os.getenv("SUNO_COOKIE")
         self.suno_model_version: str = os.getenv("SUNO_MODEL_VERSION", "chirp-v3-5")
-        
+
         # Output Configuration
         self.output_dir: Path = Path(os.getenv("OUTPUT_DIR", "./generated_songs"))
         self.downloads_dir: Path = Path(os.getenv("DOWNLOADS_DIR", "./downloads"))
-        
+
         # Application Configuration
         self.debug: bool = os.getenv("DEBUG", "false").lower() == "true"
         self.wait_audio: bool = os.getenv("WAIT_AUDIO", "true").lower() == "true"
-        
+
         # Create directories if they don't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.downloads_dir.mkdir(parents=True, exist_ok=True)
-    
+        _ensure_dir(self.output_dir)
+        _ensure_dir(self.downloads_dir)
+
     def validate(self) -> bool:
         """Validate that required configuration is present."""
         if not self.suno_cookie:
             return False
         return True
-    
+
     def get_missing_config(self) -> list[str]:
         """Get list of missing required configuration items."""
         missing = []
@@ -21,30 +21,46 @@ console = Console()
 class SunoClient:
     """Client for interacting with Suno AI music generation API."""
     
-    def __init__(self, cookie: Optional[str] = None, model_version: Optional[str] = None):
+    def __init__(self, cookie: Optional[str] = None, model_version: Optional[str] = None,
+                 client=None):
         """
         Initialize Suno client.
-        
+
         Args:
             cookie: Suno AI authentication cookie
             model_version: Model version to use for generation
+            client: Pre-built Suno client to use instead of constructing
+                one. Lets tests inject a fake without patching the suno
+                library globally (global patches rewrite shared class
+                attributes and are not safe under parallel runs).
         """
         self.cookie = cookie or config.suno_cookie
         self.model_version = model_version or config.suno_model_version
-        
+
         if not self.cookie:
             raise ValueError("Suno cookie is required. Set SUNO_COOKIE environment variable.")
-        
-        # Initialize Suno client
-        try:
-            self.client = Suno(
-                cookie=self.cookie,
-                model_version=self.model_version
-            )
-            console.print(f"✅ Suno client initialized with model: {self.model_version}", style="green")
-        except Exception as e:
-            console.print(f"❌ Failed to initialize Suno client: {e}", style="red")
-            raise
+
+        self._client = client
+
+    @property
+    def client(self):
+        """The underlying Suno client, created on first use.
+
+        Construction sets up an HTTP session and validates the cookie;
+        callers that never reach the network (e.g. negative-path checks
+        that fail before any request) skip that cost entirely.
+        """
+        if self._client is None:
+            try:
+                self._client = Suno(
+                    cookie=self.cookie,
+                    model_version=self.model_version
+                )
+                console.print(f"✅ Suno client initialized with model: {self.model_version}", style="green")
+            except Exception as e:
+                console.print(f"❌ Failed to initialize Suno client: {e}", style="red")
+                raise
+        return self._client
     
     def generate_song(
         self,
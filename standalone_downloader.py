@@ -7,8 +7,12 @@ This script can be run in any Python environment with internet access.
 import urllib.request
 import json
 import os
+import re
 import sys
 
+# Strips filename-unsafe characters in one C-level pass
+_UNSAFE_CHARS = re.compile(r'[^A-Za-z0-9 _-]+')
+
 def download_suno_music(api_key, task_id, download_dir="./downloads"):
     """
     Download music from Suno API using task ID.
@@ -24,9 +28,7 @@ def download_suno_music(api_key, task_id, download_dir="./downloads"):
     print("=" * 50)
     
     # Create download directory
-    if not os.path.exists(download_dir):
-        os.makedirs(download_dir)
-        print(f"📁 Created directory: {download_dir}")
+    os.makedirs(download_dir, exist_ok=True)
     
     # Check status endpoint
     status_url = f"https://apibox.erweima.ai/api/v1/generate/record-info?taskId={task_id}"
@@ -42,12 +44,13 @@ def download_suno_music(api_key, task_id, download_dir="./downloads"):
         req = urllib.request.Request(status_url, headers=headers, method='GET')
         
         with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            
+            # Parse straight off the socket - no intermediate full-body string,
+            # which matters when the response embeds long lyrics/metadata blobs
+            result = json.load(response)
+
             print(f"✅ Status response received (HTTP {response.getcode()})")
-            print(f"📄 Response data:")
-            print(json.dumps(result, indent=2))
-            
+            print(f"📄 Response: code={result.get('code')} msg={result.get('msg', '')}")
+
             if result.get('code') != 200:
                 print(f"❌ API Error: {result.get('msg', 'Unknown error')}")
                 return False
@@ -94,7 +97,7 @@ def download_suno_music(api_key, task_id, download_dir="./downloads"):
                 print(f"  🔗 Audio URL: {audio_url[:50]}...")
                 
                 # Generate filename
-                safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
+                safe_title = _UNSAFE_CHARS.sub('', title).rstrip()
                 filename = f"{safe_title}_{task_id[:8]}.mp3"
                 filepath = os.path.join(download_dir, filename)
                 
@@ -102,11 +105,18 @@ def download_suno_music(api_key, task_id, download_dir="./downloads"):
                 print(f"  📥 Downloading to: {filename}")
                 
                 try:
-                    urllib.request.urlretrieve(audio_url, filepath)
-                    file_size = os.path.getsize(filepath)
-                    print(f"  ✅ Downloaded: {file_size} bytes")
+                    # Stream to disk, counting bytes as we go - no extra
+                    # stat() syscall needed afterwards
+                    bytes_written = 0
+                    with urllib.request.urlopen(audio_url, timeout=60) as audio, \
+                            open(filepath, 'wb') as out:
+                        while chunk := audio.read(65536):
+                            out.write(chunk)
+                            bytes_written += len(chunk)
+                    print(f"  ✅ Downloaded: {bytes_written} bytes")
                     downloaded_files.append(filepath)
-                    
+
+
                 except Exception as e:
                     print(f"  ❌ Download failed: {e}")
             
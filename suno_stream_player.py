@@ -5,17 +5,68 @@ Suno Stream Player - Generate and stream music directly with controls
 
 import requests
 import json
+import random
+import shutil
+import tempfile
+import threading
 import time
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import List, Dict, Optional
 
 # Configuration
 API_KEY = "4e2feeb494648a5f5845dd5b65558544"
 BASE_URL = "https://apibox.erweima.ai"
 
+# Set SUNO_CALLBACK_URL to a publicly reachable URL (e.g. an ngrok tunnel
+# forwarding to SUNO_CALLBACK_PORT) and completion is pushed to us instead
+# of polled for. Without it we fall back to status polling.
+CALLBACK_URL = os.environ.get('SUNO_CALLBACK_URL')
+CALLBACK_PORT = int(os.environ.get('SUNO_CALLBACK_PORT', '8765'))
+
+# Generate payload never varies except for the prompt, so the constant
+# fields are built once at import time
+_PAYLOAD_BASE = {
+    "customMode": False,
+    "instrumental": False,
+    "model": "V3_5",
+    "callBackUrl": CALLBACK_URL or "https://httpbin.org/post",
+}
+
+
+class _CallbackHandler(BaseHTTPRequestHandler):
+    """Receives the Suno completion callback and hands the payload to the player."""
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except (ValueError, UnicodeDecodeError):
+            payload = None
+        self.send_response(200)
+        self.end_headers()
+        if payload is not None:
+            self.server.callback_payload = payload
+            self.server.callback_event.set()
+
+    def log_message(self, format, *args):
+        pass  # keep the player's terminal output clean
+
 class SunoStreamPlayer:
+    # Hoisted out of log() so the hot logging path doesn't rebuild the
+    # color table on every call
+    _COLORS = {
+        "blue": "\033[0;34m",
+        "green": "\033[0;32m",
+        "yellow": "\033[1;33m",
+        "red": "\033[0;31m",
+        "cyan": "\033[0;36m",
+    }
+    _RESET = "\033[0m"
+
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
@@ -23,32 +74,38 @@ class SunoStreamPlayer:
             'Content-Type': 'application/json',
             'User-Agent': 'SunoStreamPlayer/1.0'
         })
+        # Background prefetches started while we're still polling, keyed by track id
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=2)
+        self._prefetch_futures = {}
+        self._player = None
+        self._callback_server = None
+        if CALLBACK_URL:
+            self._start_callback_server()
+
+    def _start_callback_server(self):
+        """Listen for the generation-complete webhook so we don't have to poll."""
+        try:
+            server = ThreadingHTTPServer(('0.0.0.0', CALLBACK_PORT), _CallbackHandler)
+        except OSError as e:
+            self.log(f"⚠️  Callback server unavailable ({e}), falling back to polling", "yellow")
+            return
+        server.callback_event = threading.Event()
+        server.callback_payload = None
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self._callback_server = server
+        self.log(f"ℹ️  Callback server listening on port {CALLBACK_PORT}", "cyan")
     
     def log(self, message: str, color: str = "blue"):
-        colors = {
-            "blue": "\033[0;34m",
-            "green": "\033[0;32m", 
-            "yellow": "\033[1;33m",
-            "red": "\033[0;31m",
-            "cyan": "\033[0;36m",
-            "reset": "\033[0m"
-        }
-        print(f"{colors.get(color, '')}{message}{colors['reset']}")
+        print(f"{self._COLORS.get(color, '')}{message}{self._RESET}")
     
     def generate_music(self, prompt: str) -> Optional[str]:
         """Generate music and return task ID."""
         self.log(f"🎵 Generating music: '{prompt}'")
         
-        payload = {
-            "prompt": prompt,
-            "customMode": False,
-            "instrumental": False,
-            "model": "V3_5",
-            "callBackUrl": "https://httpbin.org/post"
-        }
-        
+        body = json.dumps({**_PAYLOAD_BASE, "prompt": prompt})
+
         try:
-            response = self.session.post(f"{BASE_URL}/api/v1/generate", json=payload, timeout=30)
+            response = self.session.post(f"{BASE_URL}/api/v1/generate", data=body, timeout=30)
             response.raise_for_status()
             
             result = response.json()
@@ -64,72 +121,199 @@ class SunoStreamPlayer:
             self.log(f"❌ Generation failed: {e}", "red")
             return None
     
-    def wait_for_music(self, task_id: str) -> List[Dict]:
-        """Wait for music generation and return track data."""
+    def iter_ready_tracks(self, task_id: str):
+        """Yield tracks one by one as they become playable.
+
+        Playback can start on the first finished track while its siblings
+        are still rendering; the generator keeps polling and yields the
+        stragglers until every known track has appeared or the timeout hits.
+        """
         self.log("⏳ Waiting for music generation...")
-        
-        max_attempts = 24  # 6 minutes total
-        for attempt in range(1, max_attempts + 1):
-            time.sleep(15)
-            self.log(f"ℹ️  Status check #{attempt} ({attempt * 15}s elapsed)", "cyan")
-            
+
+        max_wait = 360  # 6 minutes total
+
+        if self._callback_server:
+            tracks = self._wait_for_callback(max_wait)
+            if tracks:
+                yield from tracks
+                return
+            self.log("⚠️  No callback received, falling back to polling", "yellow")
+
+        delay = 3.0  # Exponential backoff with jitter, capped at 30s
+        start_time = time.time()
+        attempt = 0
+        seen_ids = set()
+        while True:
+            time.sleep(random.uniform(0, delay))
+            attempt += 1
+            elapsed = int(time.time() - start_time)
+            self.log(f"ℹ️  Status check #{attempt} ({elapsed}s elapsed)", "cyan")
+
             try:
                 response = self.session.get(
                     f"{BASE_URL}/api/v1/generate/record-info?taskId={task_id}",
                     timeout=30
                 )
                 response.raise_for_status()
-                
-                result = response.json()
+
+                # Decode the raw bytes directly - skips requests' per-call
+                # charset detection in response.json()
+                result = json.loads(response.content)
                 if result.get('code') == 200:
                     data = result.get('data', {})
                     suno_data = data.get('response', {}).get('sunoData', [])
-                    
-                    # Check if we have tracks with stream URLs
-                    ready_tracks = []
-                    for track in suno_data:
-                        stream_url = track.get('streamAudioUrl')
-                        if stream_url and stream_url != "null":
-                            ready_tracks.append({
-                                'title': track.get('title', 'Untitled'),
-                                'stream_url': stream_url,
-                                'id': track.get('id'),
-                                'tags': track.get('tags', ''),
-                                'duration': track.get('duration')
-                            })
-                    
-                    if ready_tracks:
-                        self.log(f"✅ Music ready! Found {len(ready_tracks)} track(s)", "green")
-                        return ready_tracks
-                
+
+                    # Tracks with stream URLs we haven't yielded yet
+                    ready_tracks = [
+                        {
+                            'title': track.get('title', 'Untitled'),
+                            'stream_url': stream_url,
+                            'id': track.get('id'),
+                            'tags': track.get('tags', ''),
+                            'duration': track.get('duration')
+                        }
+                        for track in suno_data
+                        if (stream_url := track.get('streamAudioUrl'))
+                        and stream_url != "null"
+                        and track.get('id') not in seen_ids
+                    ]
+
+                    for track in ready_tracks:
+                        seen_ids.add(track['id'])
+                        self._start_prefetch(track)
+                        self.log(f"✅ Track ready: {track['title']}", "green")
+                        yield track
+
+                    if suno_data:
+                        if len(seen_ids) >= len(suno_data):
+                            return  # every known track has been yielded
+
+                        # Remaining tracks are close behind - poll quickly
+                        delay = 2.5
+
             except Exception as e:
                 self.log(f"⚠️  Status check failed: {e}", "yellow")
-            
-            if attempt == max_attempts:
+
+            delay = min(30.0, delay * 2)
+            if time.time() - start_time >= max_wait:
                 self.log("⚠️  Timeout reached after 6 minutes", "yellow")
-                break
-        
-        return []
+                return
+
+    def wait_for_music(self, task_id: str) -> List[Dict]:
+        """Wait for music generation and return all track data."""
+        return list(self.iter_ready_tracks(task_id))
     
-    def find_audio_player(self) -> Optional[str]:
-        """Find available audio player."""
-        players = ['mpv', 'vlc', 'mplayer', 'ffplay']
-        
-        for player in players:
+    def _wait_for_callback(self, max_wait: int) -> List[Dict]:
+        """Block on the completion webhook instead of issuing status polls."""
+        server = self._callback_server
+        if not server.callback_event.wait(timeout=max_wait):
+            return []
+
+        payload = server.callback_payload or {}
+        callback_data = payload.get('data', {})
+        tracks = []
+        for track in callback_data.get('data', []):
+            stream_url = (track.get('stream_audio_url')
+                          or track.get('streamAudioUrl')
+                          or track.get('audio_url'))
+            if stream_url and stream_url != "null":
+                tracks.append({
+                    'title': track.get('title', 'Untitled'),
+                    'stream_url': stream_url,
+                    'id': track.get('id'),
+                    'tags': track.get('tags', ''),
+                    'duration': track.get('duration')
+                })
+
+        if tracks:
+            self.log(f"✅ Callback received! {len(tracks)} track(s) ready", "green")
+            for track in tracks:
+                self._start_prefetch(track)
+        return tracks
+
+    def _start_prefetch(self, track: Dict):
+        """Kick off a background download of the track's stream into a temp file."""
+        track_id = track.get('id')
+        if track_id is None or track_id in self._prefetch_futures:
+            return
+        self._prefetch_futures[track_id] = self._prefetch_executor.submit(
+            self._prefetch_to_tmp, track['stream_url']
+        )
+
+    def _prefetch_to_tmp(self, stream_url: str) -> str:
+        """Stream a track to a temp file so playback starts from warm cache."""
+        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
+            # Bare requests.get, not self.session - the CDN host
+            # shouldn't see the Suno API key in the session headers
+            with requests.get(stream_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(65536):
+                    f.write(chunk)
+            return f.name
+
+    def _prefetched_path(self, track: Dict) -> Optional[str]:
+        """Return the local path of a finished prefetch, if one exists."""
+        future = self._prefetch_futures.get(track.get('id'))
+        if future and future.done() and not future.exception():
+            return future.result()
+        return None
+
+    def _discard_prefetch(self, track: Dict):
+        """Drop a consumed prefetch and unlink its temp file."""
+        future = self._prefetch_futures.pop(track.get('id'), None)
+        if future and future.done() and not future.exception():
             try:
-                subprocess.run([player, '--version'], 
-                             capture_output=True, timeout=5)
+                os.unlink(future.result())
+            except OSError:
+                pass
+
+    def _cleanup_prefetches(self):
+        """Unlink every remaining prefetched temp file."""
+        for track_id in list(self._prefetch_futures):
+            future = self._prefetch_futures.pop(track_id)
+            if future.done() and not future.exception():
+                try:
+                    os.unlink(future.result())
+                except OSError:
+                    pass
+
+    def find_audio_player(self) -> Optional[str]:
+        """Find available audio player (cached after the first lookup)."""
+        if self._player:
+            return self._player
+
+        for player in ('mpv', 'vlc', 'mplayer', 'ffplay'):
+            if shutil.which(player):
+                self._player = player
                 return player
-            except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
-                continue
-        
+
         return None
     
+    def _stream_looks_playable(self, stream_url: str) -> bool:
+        """HEAD the stream URL to catch dead links before spawning a player."""
+        try:
+            head = self.session.head(stream_url, allow_redirects=True, timeout=5)
+            if not head.ok:
+                return False
+            length = head.headers.get('Content-Length')
+            # Chunked streams have no length; only reject confirmed stubs
+            return length is None or int(length) > 10000
+        except (requests.RequestException, ValueError):
+            # Can't tell - let the player try rather than refusing playback
+            return True
+
     def play_stream(self, track: Dict) -> bool:
         """Play a stream with the best available player."""
         title = track['title']
-        stream_url = track['stream_url']
-        
+        local_path = self._prefetched_path(track)
+        stream_url = local_path or track['stream_url']
+
+        # Cheap sanity check before paying for a player fork+exec; a dead
+        # URL here lets "play all" skip straight to the next track
+        if stream_url.startswith('http') and not self._stream_looks_playable(stream_url):
+            self.log(f"❌ Stream not playable, skipping: {title}", "red")
+            return False
+
         self.log(f"▶️  Now playing: {title}", "green")
         self.log(f"ℹ️  Stream URL: {stream_url[:50]}...", "cyan")
         
@@ -158,8 +342,13 @@ class SunoStreamPlayer:
                     f'--title=Suno: {title}',
                     '--no-video',
                     '--volume=70',
-                    '--osd-level=2',
-                    '--osd-duration=2000'
+                    # Terminal progress bar instead of per-frame OSD repaints,
+                    # plus aggressive readahead to ride out slow links
+                    '--term-osd-bar',
+                    '--osd-level=1',
+                    '--cache=yes',
+                    '--cache-secs=10',
+                    '--demuxer-readahead-secs=20'
                 ])
                 
             elif player == 'vlc':
@@ -209,9 +398,18 @@ class SunoStreamPlayer:
         except Exception as e:
             self.log(f"❌ Playback failed: {e}", "red")
             return False
-    
+        finally:
+            # The warm copy served its purpose - don't leave MP3s in /tmp
+            if local_path:
+                self._discard_prefetch(track)
+
     def select_and_play_tracks(self, tracks: List[Dict]):
         """Handle track selection and playback."""
+        # Warm the cache for every track up front so whichever one the user
+        # picks (or the "play all" loop reaches next) starts from local disk
+        for track in tracks:
+            self._start_prefetch(track)
+
         if len(tracks) == 1:
             # Only one track, play it directly
             self.play_stream(tracks[0])
@@ -276,16 +474,28 @@ class SunoStreamPlayer:
         if not task_id:
             return
         
-        # Wait for completion
-        tracks = self.wait_for_music(task_id)
-        if not tracks:
-            self.log("❌ No tracks were generated", "red")
-            return
-        
-        # Play tracks
-        self.select_and_play_tracks(tracks)
-        
-        self.log("🎉 Playback completed!", "green")
+        # Play the first track as soon as it's ready; collect the rest
+        # while it plays instead of blocking until the whole batch is done
+        try:
+            played_first = False
+            later_tracks = []
+            for track in self.iter_ready_tracks(task_id):
+                if not played_first:
+                    played_first = True
+                    self.play_stream(track)
+                else:
+                    later_tracks.append(track)
+
+            if not played_first:
+                self.log("❌ No tracks were generated", "red")
+                return
+
+            if later_tracks:
+                self.select_and_play_tracks(later_tracks)
+
+            self.log("🎉 Playback completed!", "green")
+        finally:
+            self._cleanup_prefetches()
 
 def main():
     """Entry point."""
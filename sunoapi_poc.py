@@ -1,63 +1,77 @@
 #!/usr/bin/env python3
 """Suno POC using SunoAPI.org service."""
 
-import urllib.request
-import urllib.parse
+import functools
 import json
 import os
+import random
 import time
 import sys
+import urllib.request
+
+import requests
+from requests.adapters import HTTPAdapter
 
 # SunoAPI.org Configuration
 BASE_URL = "https://apibox.erweima.ai"
 GENERATE_ENDPOINT = "/api/v1/generate"
 DETAILS_ENDPOINT = "/api/v1/details"
 
+# Shared session so every generate/status/details call reuses one TCP+TLS
+# connection instead of paying a fresh handshake per poll.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=20))
+SESSION.headers.update({'User-Agent': 'SunoPOC/1.0'})
+
+# Constant JSON shell for the default (simple-mode) generate request; only
+# the prompt varies, so per-call dict building + full serialization is skipped
+_GENERATE_TEMPLATE = (
+    '{"prompt":%s,"customMode":false,"instrumental":false,'
+    '"model":"V3_5","callBackUrl":"https://httpbin.org/post"}'
+)
+
+@functools.lru_cache(maxsize=1)
 def load_api_key():
-    """Load API key from .env file."""
-    env_file = ".env"
-    if os.path.exists(env_file):
-        with open(env_file, 'r') as f:
-            content = f.read()
-            for line in content.split('\n'):
+    """Load API key from .env file (cached after the first read)."""
+    try:
+        with open(".env", 'r') as f:
+            for line in f:
                 if line.startswith('SUNO_API_KEY='):
                     return line.split('=', 1)[1].strip()
+    except FileNotFoundError:
+        pass
     return None
 
 def make_api_request(endpoint, data=None, api_key=None):
     """Make HTTP request to SunoAPI.org."""
     url = f"{BASE_URL}{endpoint}"
-    
-    headers = {
-        'Content-Type': 'application/json',
-        'Authorization': f'Bearer {api_key}',
-        'User-Agent': 'SunoPOC/1.0'
-    }
-    
-    if data:
-        data = json.dumps(data).encode('utf-8')
-    
-    req = urllib.request.Request(url, data=data, headers=headers, method='POST' if data else 'GET')
-    
+
+    headers = {'Authorization': f'Bearer {api_key}'}
+    kwargs = {'headers': headers, 'timeout': 30}
+    if isinstance(data, str):
+        # Already-serialized JSON body (see _GENERATE_TEMPLATE)
+        headers['Content-Type'] = 'application/json'
+        kwargs['data'] = data
+    elif data is not None:
+        kwargs['json'] = data
+
     try:
-        with urllib.request.urlopen(req, timeout=30) as response:
-            response_data = response.read().decode('utf-8')
-            result = json.loads(response_data)
+        response = SESSION.request('POST' if data else 'GET', url, **kwargs)
+        if response.ok:
             return {
                 'success': True,
-                'status_code': response.getcode(),
-                'data': result
+                'status_code': response.status_code,
+                'data': response.json()
             }
-    except urllib.error.HTTPError as e:
-        error_data = e.read().decode('utf-8') if e.fp else str(e)
+
         try:
-            error_json = json.loads(error_data)
-        except:
-            error_json = {'msg': error_data}
-        
+            error_json = response.json()
+        except ValueError:
+            error_json = {'msg': response.text}
+
         return {
             'success': False,
-            'status_code': e.code,
+            'status_code': response.status_code,
             'error': error_json
         }
     except Exception as e:
@@ -74,22 +88,27 @@ def generate_music(api_key, prompt, custom_mode=False, instrumental=False, style
     print(f"Mode: {'Custom' if custom_mode else 'Simple'}")
     print(f"Model: {model}")
 
-    # Prepare payload according to API documentation
-    payload = {
-        "prompt": prompt,
-        "customMode": custom_mode,
-        "instrumental": instrumental,
-        "model": model,
-        "callBackUrl": "https://httpbin.org/post"  # Using httpbin as a dummy callback for testing
-    }
-    
-    # Add optional parameters for custom mode
-    if custom_mode:
-        if style:
-            payload["style"] = style
-        if title:
-            payload["title"] = title
-    
+    if not custom_mode and not instrumental and model == "V3_5":
+        # Common case: splice the prompt into the precomputed JSON shell
+        payload = _GENERATE_TEMPLATE % json.dumps(prompt)
+    else:
+        # Prepare payload according to API documentation
+        payload = {
+            "prompt": prompt,
+            "customMode": custom_mode,
+            "instrumental": instrumental,
+            "model": model,
+            "callBackUrl": "https://httpbin.org/post"  # Using httpbin as a dummy callback for testing
+        }
+
+        # Add optional parameters for custom mode
+        if custom_mode:
+            if style:
+                payload["style"] = style
+            if title:
+                payload["title"] = title
+
+
     print(f"📡 Sending request to SunoAPI.org...")
     result = make_api_request(GENERATE_ENDPOINT, payload, api_key)
     
@@ -135,11 +154,11 @@ def wait_for_completion(api_key, task_id, max_wait_time=300):
     print(f"Max wait time: {max_wait_time} seconds")
     
     start_time = time.time()
-    check_interval = 10  # Check every 10 seconds
-    
+    delay = 3.0  # Exponential backoff, capped at 30s
+
     while (time.time() - start_time) < max_wait_time:
         status_data = check_task_status(api_key, task_id)
-        
+
         if status_data:
             # Check if we have completed tracks
             tracks = status_data.get('data', [])
@@ -149,19 +168,21 @@ def wait_for_completion(api_key, task_id, max_wait_time=300):
                 if completed_tracks:
                     print(f"✅ Generation completed! {len(completed_tracks)} track(s) ready.")
                     return completed_tracks
-        
+                # Tracks exist but audio isn't ready yet - keep polling quickly
+                delay = 2.5
+
         elapsed = int(time.time() - start_time)
         print(f"⏳ Still generating... ({elapsed}s elapsed)")
-        time.sleep(check_interval)
+        delay = min(30.0, delay * 2)
+        time.sleep(random.uniform(0, delay))
     
     print(f"⚠️ Timeout reached after {max_wait_time} seconds")
     return None
 
 def download_track(track, download_dir="./downloads"):
     """Download a generated music track."""
-    if not os.path.exists(download_dir):
-        os.makedirs(download_dir)
-    
+    os.makedirs(download_dir, exist_ok=True)
+
     audio_url = track.get('audio_url')
     track_id = track.get('id', 'unknown')
     title = track.get('title', 'untitled').replace(' ', '_')
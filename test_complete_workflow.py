@@ -3,33 +3,46 @@
 Test the complete voice-to-Suno-to-JBL workflow
 """
 
+import subprocess
 import sys
 import os
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to Python path (once - repeat imports of these
+# test modules shouldn't stack duplicate entries)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from voice_to_suno_jbl import VoiceToSunoJBL
+# VoiceToSunoJBL is imported lazily inside the tests that need it - it
+# drags in speech_recognition/PyAudio, which costs seconds at startup
 
-def test_jbl_audio():
+def _yes(prompt):
+    """Ask a y/n question; one readline, no intermediate string churn."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline()[:1].lower() == 'y'
+
+def test_jbl_audio(app):
     """Test JBL audio output."""
     print("🔊 Testing JBL Audio Output")
     print("=" * 40)
-    
-    app = VoiceToSunoJBL()
-    
+
     # Test JBL connection
     if app.set_jbl_as_default():
         print("✅ JBL set as default audio device")
         
-        # Test with system sound
-        import subprocess
+        # Test with system sound; PulseAudio's ALSA warnings go to /dev/null
+        # instead of spamming the terminal through the parent process
         try:
-            subprocess.run(['paplay', '/usr/share/sounds/alsa/Front_Right.wav', 
-                          '--device=bluez_output.04_CB_88_B8_CF_72.1'], 
-                         check=True, timeout=5)
+            subprocess.run(['paplay', '/usr/share/sounds/alsa/Front_Right.wav',
+                          '--device=bluez_output.04_CB_88_B8_CF_72.1'],
+                         check=True, timeout=5,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             print("✅ JBL audio test successful!")
             return True
+        except subprocess.TimeoutExpired:
+            print("❌ JBL audio test timed out after 5s")
+            return False
         except Exception as e:
             print(f"❌ JBL audio test failed: {e}")
             return False
@@ -37,13 +50,11 @@ def test_jbl_audio():
         print("❌ Could not set JBL as default")
         return False
 
-def test_voice_recognition():
+def test_voice_recognition(app):
     """Test voice recognition."""
     print("\n🎤 Testing Voice Recognition")
     print("=" * 40)
-    
-    app = VoiceToSunoJBL()
-    
+
     print("🎤 Say something (you have 10 seconds)...")
     prompt = app.listen_for_voice_command()
     
@@ -54,13 +65,11 @@ def test_voice_recognition():
         print("❌ Voice recognition failed")
         return None
 
-def test_music_generation(prompt="happy upbeat song"):
+def test_music_generation(app, prompt="happy upbeat song"):
     """Test music generation."""
     print(f"\n🎵 Testing Music Generation")
     print("=" * 40)
-    
-    app = VoiceToSunoJBL()
-    
+
     # Generate music
     task_id = app.generate_music(prompt)
     if not task_id:
@@ -76,13 +85,11 @@ def test_music_generation(prompt="happy upbeat song"):
         print("❌ Music generation timed out")
         return None
 
-def test_complete_workflow():
+def test_complete_workflow(app):
     """Test the complete workflow."""
     print("\n🎯 Testing Complete Workflow")
     print("=" * 40)
-    
-    app = VoiceToSunoJBL()
-    
+
     print("🎤 This will test the complete voice-to-music workflow")
     print("📝 You'll be asked to speak a music request")
     print("🎵 The system will generate music and play it on your JBL")
@@ -108,26 +115,30 @@ def main():
     print("=" * 50)
     
     try:
+        # One app for the whole run - re-instantiating re-runs microphone
+        # calibration and device probing for every test
+        from voice_to_suno_jbl import VoiceToSunoJBL
+        app = VoiceToSunoJBL()
+
         # Test 1: JBL Audio
-        jbl_ok = test_jbl_audio()
-        
+        jbl_ok = test_jbl_audio(app)
+
         if not jbl_ok:
             print("\n❌ JBL audio test failed - please check your speaker connection")
             return False
         
         # Test 2: Voice Recognition (optional)
-        print("\n🎤 Would you like to test voice recognition? (y/n): ", end="")
-        if input().lower().startswith('y'):
-            voice_prompt = test_voice_recognition()
+        if _yes("\n🎤 Would you like to test voice recognition? (y/n): "):
+            voice_prompt = test_voice_recognition(app)
             if voice_prompt:
                 # Test 3: Music Generation with voice prompt
-                tracks = test_music_generation(voice_prompt)
+                tracks = test_music_generation(app, voice_prompt)
             else:
                 print("⚠️  Voice recognition failed, using default prompt")
-                tracks = test_music_generation()
+                tracks = test_music_generation(app)
         else:
             # Test 3: Music Generation with default prompt
-            tracks = test_music_generation()
+            tracks = test_music_generation(app)
         
         if not tracks:
             print("\n❌ Music generation test failed")
@@ -135,7 +146,6 @@ def main():
         
         # Test 4: Play on JBL
         print(f"\n🔊 Playing generated music on JBL...")
-        app = VoiceToSunoJBL()
         for track in tracks:
             success = app.play_on_jbl(track)
             if success:
@@ -143,9 +153,8 @@ def main():
                 break
         
         # Test 5: Complete workflow (optional)
-        print("\n🎯 Would you like to test the complete voice workflow? (y/n): ", end="")
-        if input().lower().startswith('y'):
-            test_complete_workflow()
+        if _yes("\n🎯 Would you like to test the complete voice workflow? (y/n): "):
+            test_complete_workflow(app)
         
         print("\n🎉 All tests completed!")
         return True
@@ -3,39 +3,109 @@
 Complete workflow test with full debugging output and persistent logs
 """
 
+import atexit
+import collections
+import subprocess
 import sys
 import os
+import threading
 import time
+import traceback
 import datetime
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to Python path (once - repeat imports of these
+# test modules shouldn't stack duplicate entries)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from voice_to_suno_jbl import VoiceToSunoJBL
+# VoiceToSunoJBL is imported lazily inside the tests that need it - it
+# drags in speech_recognition/PyAudio, which costs seconds at startup
+
+def _yes(prompt):
+    """Ask a y/n question; one readline, no intermediate string churn."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline()[:1].lower() == 'y'
 
 class DebugLogger:
     """Logger that keeps all output visible and saves to file."""
-    
+
+    # Cached line template; swapping in a structured (e.g. JSON) form later
+    # is a one-line change
+    _FMT = "[{t}] [{lvl:5}] [{e:6.1f}s] {m}"
+
     def __init__(self):
         self.log_file = f"jbl_suno_debug_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         self.session_start = time.time()
-    
+        # Timestamps are derived from one monotonic read per line instead of
+        # a datetime.now().strftime() call, which is ~10x slower
+        self._start_mono = time.monotonic()
+        local = time.localtime(self.session_start)
+        self._start_day_secs = (local.tm_hour * 3600 + local.tm_min * 60
+                                + local.tm_sec + self.session_start % 1)
+        # Raw append-mode fd: os.write skips the io module's buffer lock,
+        # and the drain thread batches lines into one write() per cycle
+        try:
+            self._fd = os.open(self.log_file,
+                               os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        except OSError:
+            self._fd = None
+        # Writes happen on a background thread so slow stdout/disk I/O
+        # doesn't land inside the workflow timings we're measuring
+        self._queue = collections.deque(maxlen=8192)
+        self._pending = threading.Event()
+        threading.Thread(target=self._drain, daemon=True).start()
+        atexit.register(self.close)
+
+    def _drain(self):
+        """Consume queued log lines and write them out in batches."""
+        while True:
+            self._pending.wait()
+            self._pending.clear()
+            batch = []
+            while self._queue:
+                batch.append(self._queue.popleft())
+            if not batch:
+                continue
+            text = "\n".join(batch) + "\n"
+            # Console first (always visible), then one write() for the file
+            sys.stdout.write(text)
+            if self._fd is not None:
+                try:
+                    os.write(self._fd, text.encode("utf-8"))
+                except:
+                    pass  # Don't let logging errors break the app
+
+    def flush(self):
+        """Block until every queued line has been written."""
+        while self._queue:
+            time.sleep(0.01)
+        sys.stdout.flush()
+
+    def close(self):
+        """Flush remaining lines and close the log file descriptor."""
+        self.flush()
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
     def log(self, message, level="INFO"):
         """Log message with timestamp."""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        elapsed = time.time() - self.session_start
-        
-        log_line = f"[{timestamp}] [{level:5}] [{elapsed:6.1f}s] {message}"
-        
-        # Print to console (always visible)
-        print(log_line)
-        
-        # Save to file
-        try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(log_line + "\n")
-        except:
-            pass  # Don't let logging errors break the app
+        elapsed = time.monotonic() - self._start_mono
+        day = (self._start_day_secs + elapsed) % 86400
+        secs = int(day)
+        ms = int((day - secs) * 1000)
+        timestamp = f"{secs // 3600:02d}:{(secs // 60) % 60:02d}:{secs % 60:02d}.{ms:03d}"
+
+        log_line = self._FMT.format(t=timestamp, lvl=level, e=elapsed, m=message)
+
+        # Hand off to the drain thread; the caller only pays for the format
+        self._queue.append(log_line)
+        self._pending.set()
     
     def section(self, title):
         """Log a section header."""
@@ -59,6 +129,7 @@ def test_complete_workflow_with_debug():
         logger.section("STEP 1: INITIALIZATION")
         logger.log("🔧 Initializing VoiceToSunoJBL application...")
         
+        from voice_to_suno_jbl import VoiceToSunoJBL
         app = VoiceToSunoJBL()
         logger.log("✅ App initialization successful")
         logger.log(f"📊 Microphone energy threshold: {app.recognizer.energy_threshold}")
@@ -66,12 +137,26 @@ def test_complete_workflow_with_debug():
         # Test JBL connection
         logger.section("STEP 2: JBL SPEAKER CONNECTION")
         logger.log("🔊 Testing JBL Flip Essentials connection...")
-        
-        jbl_success = app.set_jbl_as_default()
-        if jbl_success:
-            logger.log("✅ JBL speaker set as default audio device")
-        else:
-            logger.log("⚠️  JBL setup had issues, but continuing test", "WARN")
+
+        # Cheap probe first: on back-to-back runs the JBL is usually still
+        # the default sink, so skip the full setup round-trip
+        jbl_success = False
+        try:
+            current_sink = subprocess.run(
+                ['pactl', 'get-default-sink'],
+                capture_output=True, text=True, timeout=2).stdout.strip()
+            if current_sink == 'bluez_output.04_CB_88_B8_CF_72.1':
+                logger.log("✅ JBL already the default sink, skipping setup")
+                jbl_success = True
+        except Exception:
+            pass  # Probe failure just means we do the normal setup
+
+        if not jbl_success:
+            jbl_success = app.set_jbl_as_default()
+            if jbl_success:
+                logger.log("✅ JBL speaker set as default audio device")
+            else:
+                logger.log("⚠️  JBL setup had issues, but continuing test", "WARN")
         
         # Voice recognition test
         logger.section("STEP 3: VOICE RECOGNITION")
@@ -82,14 +167,15 @@ def test_complete_workflow_with_debug():
         logger.log("   - 'Make electronic dance music'")
         print()
         
+        logger.flush()
         input("📝 Press Enter when ready to test voice recognition...")
         
         logger.log("🎤 Starting voice recognition test...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         prompt = app.listen_for_voice_command()
         
-        recognition_time = time.time() - start_time
+        recognition_time = time.perf_counter() - start_time
         logger.log(f"⏱️  Voice recognition took {recognition_time:.1f} seconds")
         
         if prompt:
@@ -109,11 +195,11 @@ def test_complete_workflow_with_debug():
         logger.log(f"🎵 Generating music with prompt: '{prompt}'")
         logger.log("💰 Using V3_5 model for cost efficiency")
         
-        gen_start_time = time.time()
+        gen_start_time = time.perf_counter()
         task_id = app.generate_music(prompt)
         
         if task_id:
-            gen_time = time.time() - gen_start_time
+            gen_time = time.perf_counter() - gen_start_time
             logger.log(f"✅ Music generation request successful in {gen_time:.1f}s")
             logger.log(f"🆔 Task ID: {task_id}")
         else:
@@ -125,18 +211,23 @@ def test_complete_workflow_with_debug():
         logger.log("⏳ Waiting for Suno to generate your music...")
         logger.log("📡 This typically takes 1-3 minutes")
         
-        wait_start_time = time.time()
+        wait_start_time = time.perf_counter()
         tracks = app.wait_for_music(task_id)
-        wait_time = time.time() - wait_start_time
+        wait_time = time.perf_counter() - wait_start_time
         
         if tracks:
             logger.log(f"✅ Music generation completed in {wait_time:.1f}s")
-            logger.log(f"🎵 Generated {len(tracks)} track(s):")
+            # .get everywhere - a track missing a field shouldn't crash the
+            # success path - and one batched log call for the summary
+            summary_lines = []
             for i, track in enumerate(tracks):
-                logger.log(f"   Track {i+1}: '{track['title']}'")
-                logger.log(f"   Stream URL: {track['stream_url'][:50]}...")
-                if track.get('duration'):
-                    logger.log(f"   Duration: {track['duration']}s")
+                title = track.get('title', '<untitled>')
+                short_url = track.get('stream_url', '')[:50]
+                duration = track.get('duration')
+                summary_lines.append(
+                    f"   Track {i+1}: '{title}' | {short_url}... | dur={duration}")
+            logger.log(f"🎵 Generated {len(tracks)} track(s):\n"
+                       + "\n".join(summary_lines))
         else:
             logger.log(f"❌ Music generation TIMEOUT after {wait_time:.1f}s", "ERROR")
             logger.log(f"🆔 Task ID for later checking: {task_id}")
@@ -145,22 +236,23 @@ def test_complete_workflow_with_debug():
         # JBL playback
         logger.section("STEP 6: JBL PLAYBACK")
         logger.log("🔊 Preparing to play generated music on JBL speaker...")
-        logger.log("🎮 Playback controls:")
-        logger.log("   SPACE - Play/Pause")
-        logger.log("   q - Quit")
-        logger.log("   ↑↓ - Volume up/down")
-        logger.log("   ←→ - Seek backward/forward")
+        logger.log("🎮 Playback controls:\n"
+                   "   SPACE - Play/Pause\n"
+                   "   q - Quit\n"
+                   "   ↑↓ - Volume up/down\n"
+                   "   ←→ - Seek backward/forward")
         print()
         
+        logger.flush()
         input("📝 Press Enter when ready to play music on JBL...")
         
         playback_success = False
         for i, track in enumerate(tracks):
             logger.log(f"🎵 Playing track {i+1}/{len(tracks)}: '{track['title']}'")
             
-            play_start_time = time.time()
+            play_start_time = time.perf_counter()
             success = app.play_on_jbl(track)
-            play_time = time.time() - play_start_time
+            play_time = time.perf_counter() - play_start_time
             
             if success:
                 logger.log(f"✅ Track {i+1} playback completed ({play_time:.1f}s)")
@@ -170,21 +262,27 @@ def test_complete_workflow_with_debug():
             
             # Ask about next track
             if len(tracks) > 1 and i < len(tracks) - 1:
-                choice = input(f"\n📝 Play next track? (y/n): ")
-                if not choice.lower().startswith('y'):
+                if not _yes(f"\n📝 Play next track? (y/n): "):
                     logger.log("⏹️  User stopped playback")
                     break
         
         # Final summary
         logger.section("WORKFLOW SUMMARY")
-        logger.log("📊 Test Results:")
-        logger.log(f"   ✅ App Initialization: SUCCESS")
-        logger.log(f"   {'✅' if jbl_success else '⚠️ '} JBL Connection: {'SUCCESS' if jbl_success else 'PARTIAL'}")
-        logger.log(f"   {'✅' if use_voice else '❌'} Voice Recognition: {'SUCCESS' if use_voice else 'FAILED'}")
-        logger.log(f"   ✅ Music Generation: SUCCESS")
-        logger.log(f"   {'✅' if playback_success else '❌'} JBL Playback: {'SUCCESS' if playback_success else 'FAILED'}")
-        
-        overall_success = jbl_success and (use_voice or prompt) and task_id and tracks and playback_success
+        # Table-driven so adding a step is one append, not four edits
+        steps = [
+            ("App Initialization", True),
+            ("JBL Connection", jbl_success),
+            ("Voice Recognition", use_voice),
+            ("Music Generation", bool(task_id)),
+            ("JBL Playback", playback_success),
+        ]
+        logger.log("📊 Test Results:\n" + "\n".join(
+            f"   {'✅' if ok else '❌'} {name}: {'SUCCESS' if ok else 'FAILED'}"
+            for name, ok in steps))
+
+        # A manual prompt substitutes for failed voice recognition
+        overall_success = (use_voice or bool(prompt)) and all(
+            ok for name, ok in steps if name != "Voice Recognition")
         logger.log(f"🎯 Overall Result: {'COMPLETE SUCCESS' if overall_success else 'PARTIAL SUCCESS'}")
         
         if not use_voice:
@@ -192,7 +290,8 @@ def test_complete_workflow_with_debug():
         
         logger.log(f"📁 Complete debug log saved to: {logger.log_file}")
         logger.log("📋 You can copy/paste these logs for debugging")
-        
+        logger.flush()
+
         return overall_success
         
     except KeyboardInterrupt:
@@ -200,30 +299,33 @@ def test_complete_workflow_with_debug():
         return False
     except Exception as e:
         logger.log(f"💥 CRITICAL ERROR: {e}", "ERROR")
-        import traceback
-        logger.log("📋 Full traceback:", "ERROR")
-        for line in traceback.format_exc().split('\n'):
-            if line.strip():
-                logger.log(f"   {line}", "ERROR")
+        # One atomic entry for the whole traceback - no interleaving with
+        # other lines going through the drain thread
+        tb_lines = [l for l in traceback.format_exc().split('\n') if l.strip()]
+        logger.log("📋 Full traceback:\n"
+                   + "\n".join(f"   {l}" for l in tb_lines), "ERROR")
         return False
 
 def main():
     """Main function."""
-    print("🎵 JBL-Suno-DJ Complete Workflow Test with Debug Logging")
-    print("=" * 70)
-    print("📋 This test will:")
-    print("   ✅ Keep all output visible for copy/paste debugging")
-    print("   ✅ Save detailed logs to file")
-    print("   ✅ Show timestamps and elapsed time")
-    print("   ✅ Test the complete voice-to-music-to-JBL workflow")
-    print()
-    print("💡 ALSA warnings are normal and harmless!")
-    print("💡 All logs will remain visible throughout the test")
-    print()
-    
+    # One write + flush for the whole banner instead of a syscall per line
+    sys.stdout.write(
+        "🎵 JBL-Suno-DJ Complete Workflow Test with Debug Logging\n"
+        + "=" * 70 + "\n"
+        "📋 This test will:\n"
+        "   ✅ Keep all output visible for copy/paste debugging\n"
+        "   ✅ Save detailed logs to file\n"
+        "   ✅ Show timestamps and elapsed time\n"
+        "   ✅ Test the complete voice-to-music-to-JBL workflow\n"
+        "\n"
+        "💡 ALSA warnings are normal and harmless!\n"
+        "💡 All logs will remain visible throughout the test\n"
+        "\n"
+    )
+    sys.stdout.flush()
+
     try:
-        choice = input("🚀 Start complete workflow test? (y/n): ")
-        if not choice.lower().startswith('y'):
+        if not _yes("🚀 Start complete workflow test? (y/n): "):
             print("👋 Test cancelled")
             return
         
@@ -5,11 +5,21 @@ Test the crash fix for voice recognition
 
 import sys
 import os
+import traceback
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to Python path (once - repeat imports of these
+# test modules shouldn't stack duplicate entries)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from voice_to_suno_jbl import VoiceToSunoJBL
+# VoiceToSunoJBL is imported lazily inside the tests that need it - it
+# drags in speech_recognition/PyAudio, which costs seconds at startup
+
+# Hashed token lookup instead of a substring scan per keyword; also stops
+# 'rock' matching inside words like 'rockets'
+MUSIC_WORDS = frozenset({'music', 'song', 'melody', 'tune', 'beat', 'jazz',
+                         'rock', 'electronic', 'piano', 'guitar'})
 
 def test_voice_no_crash():
     """Test voice recognition without crashes."""
@@ -25,6 +35,7 @@ def test_voice_no_crash():
     try:
         # Initialize the app
         print("🔧 Initializing app...")
+        from voice_to_suno_jbl import VoiceToSunoJBL
         app = VoiceToSunoJBL()
         print("✅ App ready!")
         print()
@@ -46,9 +57,8 @@ def test_voice_no_crash():
                     print(f"📊 Length: {len(result.split())} words")
                     
                     # Check if it's a music request
-                    music_words = ['music', 'song', 'melody', 'tune', 'beat', 'jazz', 'rock', 'electronic', 'piano']
-                    has_music_words = any(word in result.lower() for word in music_words)
-                    
+                    has_music_words = bool(set(result.lower().split()) & MUSIC_WORDS)
+
                     if has_music_words:
                         print("🎵 Detected as music request!")
                         print(f"🚀 Ready to generate: '{result}'")
@@ -69,7 +79,6 @@ def test_voice_no_crash():
             except Exception as e:
                 print(f"\n❌ Error in attempt {attempt}: {e}")
                 print("💡 But the app didn't crash - that's good!")
-                import traceback
                 traceback.print_exc()
         
         print("🎉 Voice recognition test completed without crashes!")
@@ -77,7 +86,6 @@ def test_voice_no_crash():
         
     except Exception as e:
         print(f"💥 App-level error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -1,42 +1,53 @@
 #!/usr/bin/env python3
 """Test the Python environment and Suno API connectivity."""
 
+import importlib
 import sys
 import os
+import time
+import traceback
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# One pooled session for every API call in this suite - repeat requests to
+# apibox.erweima.ai reuse the TCP+TLS connection instead of re-handshaking
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+SESSION.headers.update({
+    'Content-Type': 'application/json',
+    # Compressed job-status JSON + an explicit keep-alive hint so polls
+    # stay on the warm connection
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+})
+
+# (module to import, distribution name to report)
+REQUIRED_IMPORTS = [
+    ('requests', 'requests'),
+    ('json', 'json'),
+    ('dotenv', 'python-dotenv'),
+    ('rich.console', 'rich'),
+]
 
 def test_imports():
     """Test all required imports."""
     print("🔍 Testing imports...")
-    
-    try:
-        import requests
-        print("✅ requests imported")
-    except ImportError as e:
-        print(f"❌ requests failed: {e}")
-        return False
-    
-    try:
-        import json
-        print("✅ json imported")
-    except ImportError as e:
-        print(f"❌ json failed: {e}")
-        return False
-    
-    try:
-        from dotenv import load_dotenv
-        print("✅ python-dotenv imported")
-    except ImportError as e:
-        print(f"❌ python-dotenv failed: {e}")
-        return False
-    
-    try:
-        from rich.console import Console
-        print("✅ rich imported")
-    except ImportError as e:
-        print(f"❌ rich failed: {e}")
-        return False
-    
-    return True
+
+    missing = []
+    for module, name in REQUIRED_IMPORTS:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            missing.append((name, e))
+
+    # One batched report instead of a print per import
+    lines = [f"✅ {name} imported" for module, name in REQUIRED_IMPORTS
+             if name not in {n for n, _ in missing}]
+    lines.extend(f"❌ {name} failed: {e}" for name, e in missing)
+    print("\n".join(lines))
+
+    return not missing
 
 def test_environment():
     """Test environment variables."""
@@ -62,9 +73,6 @@ def test_api_connectivity(api_key):
     print("\n🔍 Testing API connectivity...")
     
     try:
-        import requests
-        import json
-        
         url = 'https://apibox.erweima.ai/api/v1/generate'
         payload = {
             'prompt': 'test song',
@@ -73,32 +81,29 @@ def test_api_connectivity(api_key):
             'model': 'V3_5',
             'callBackUrl': 'https://httpbin.org/post'
         }
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {api_key}'
-        }
-        
+        SESSION.headers['Authorization'] = f'Bearer {api_key}'
+
         print("🚀 Making API request...")
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = SESSION.post(url, json=payload, timeout=30)
         
         print(f"📡 Response status: {response.status_code}")
-        
-        if response.status_code == 200:
-            result = response.json()
-            print(f"📄 Response: {result}")
-            
-            if result.get('code') == 200:
-                task_id = result.get('data', {}).get('taskId')
-                print(f"🎉 SUCCESS! Generated task ID: {task_id}")
-                return task_id
-            else:
-                print(f"❌ API Error: {result.get('msg', 'Unknown error')}")
-                return None
+
+        response.raise_for_status()
+        result = response.json()
+        print(f"📄 Response: {result}")
+
+        if result.get('code') == 200:
+            task_id = result.get('data', {}).get('taskId')
+            print(f"🎉 SUCCESS! Generated task ID: {task_id}")
+            return task_id
         else:
-            print(f"❌ HTTP Error: {response.status_code}")
-            print(f"Response: {response.text}")
+            print(f"❌ API Error: {result.get('msg', 'Unknown error')}")
             return None
-            
+
+    except requests.HTTPError as e:
+        print(f"❌ HTTP Error: {e.response.status_code}")
+        print(f"Response: {e.response.text}")
+        return None
     except Exception as e:
         print(f"❌ API test failed: {e}")
         return None
@@ -108,39 +113,41 @@ def test_status_check(api_key, task_id):
     print(f"\n🔍 Testing status check for task: {task_id}")
     
     try:
-        import requests
-        import time
-        
-        # Wait a bit before checking
-        print("⏳ Waiting 10 seconds before status check...")
-        time.sleep(10)
-        
         url = f'https://apibox.erweima.ai/api/v1/generate/record-info?taskId={task_id}'
-        headers = {
-            'Authorization': f'Bearer {api_key}'
-        }
-        
-        print("🚀 Checking status...")
-        response = requests.get(url, headers=headers, timeout=30)
-        
-        print(f"📡 Status response: {response.status_code}")
-        
-        if response.status_code == 200:
-            result = response.json()
-            print(f"📄 Status data: {result}")
-            
-            if result.get('code') == 200:
-                data = result.get('data')
-                print(f"✅ Status check successful!")
-                return data
+        SESSION.headers['Authorization'] = f'Bearer {api_key}'
+
+        # Poll with exponential backoff instead of one blind 10s sleep -
+        # fast tasks are caught early, slow ones still get checked
+        delay = 1.0
+        deadline = time.time() + 60
+
+        while time.time() < deadline:
+            print(f"⏳ Waiting {delay:.0f}s before status check...")
+            time.sleep(delay)
+
+            print("🚀 Checking status...")
+            response = SESSION.get(url, timeout=10)
+
+            print(f"📡 Status response: {response.status_code}")
+
+            if response.status_code == 200:
+                result = response.json()
+
+                if result.get('code') == 200 and result.get('data'):
+                    print(f"📄 Status data: {result}")
+                    print(f"✅ Status check successful!")
+                    return result['data']
+
+                print(f"⏳ Not ready yet: {result.get('msg', 'still generating')}")
             else:
-                print(f"❌ Status API Error: {result.get('msg', 'Unknown error')}")
-                return None
-        else:
-            print(f"❌ Status HTTP Error: {response.status_code}")
-            print(f"Response: {response.text}")
-            return None
-            
+                print(f"❌ Status HTTP Error: {response.status_code}")
+                print(f"Response: {response.text}")
+
+            delay = min(delay * 2, 15)
+
+        print("⚠️ Status not ready within the 60s budget")
+        return None
+
     except Exception as e:
         print(f"❌ Status check failed: {e}")
         return None
@@ -193,6 +200,5 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"\n💥 Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
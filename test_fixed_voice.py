@@ -5,26 +5,41 @@ Test the fixed voice recognition that records for full 10 seconds
 
 import sys
 import os
+import traceback
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to Python path (once - repeat imports of these
+# test modules shouldn't stack duplicate entries)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from voice_to_suno_jbl import VoiceToSunoJBL
+# VoiceToSunoJBL is imported lazily inside the tests that need it - it
+# drags in speech_recognition/PyAudio, which costs seconds at startup
+
+# Hashed token lookup instead of a substring scan per keyword; also stops
+# 'rock' matching inside words like 'rockets'
+MUSIC_WORDS = frozenset({'music', 'song', 'melody', 'tune', 'beat', 'jazz',
+                         'rock', 'electronic', 'piano', 'guitar'})
 
 def test_fixed_voice_recognition():
     """Test the fixed voice recognition."""
-    print("🎤 Testing Fixed Voice Recognition")
-    print("=" * 50)
-    print("🔧 Key improvements:")
-    print("   ✅ Records for EXACTLY 10 seconds")
-    print("   ✅ Won't stop early on pauses")
-    print("   ✅ Real-time countdown timer")
-    print("   ✅ Better speech capture")
-    print()
-    
+    # One write + flush for the whole banner instead of a syscall per line
+    sys.stdout.write(
+        "🎤 Testing Fixed Voice Recognition\n"
+        + "=" * 50 + "\n"
+        "🔧 Key improvements:\n"
+        "   ✅ Records for EXACTLY 10 seconds\n"
+        "   ✅ Won't stop early on pauses\n"
+        "   ✅ Real-time countdown timer\n"
+        "   ✅ Better speech capture\n"
+        "\n"
+    )
+    sys.stdout.flush()
+
     try:
         # Initialize the app
         print("🔧 Initializing voice recognition...")
+        from voice_to_suno_jbl import VoiceToSunoJBL
         app = VoiceToSunoJBL()
         print("✅ Voice recognition ready!")
         print()
@@ -48,19 +63,19 @@ def test_fixed_voice_recognition():
             print(f"\n🎉 SUCCESS! Full recognition: '{result}'")
             
             # Check if it's a good music request
-            music_keywords = ['music', 'song', 'melody', 'tune', 'beat', 'jazz', 'rock', 'electronic', 'piano', 'guitar']
+            has_music_words = bool(set(result.lower().split()) & MUSIC_WORDS)
             word_count = len(result.split())
-            
+
             print(f"📊 Analysis:")
             print(f"   Word count: {word_count}")
-            print(f"   Contains music keywords: {any(keyword in result.lower() for keyword in music_keywords)}")
-            
+            print(f"   Contains music keywords: {has_music_words}")
+
             if word_count >= 3:
                 print("✅ Good length - captured multiple words!")
             else:
                 print("⚠️  Short capture - try speaking more")
             
-            if any(keyword in result.lower() for keyword in music_keywords):
+            if has_music_words:
                 print("🎵 Sounds like a music request!")
                 print(f"🚀 Ready to generate music with: '{result}'")
             else:
@@ -82,7 +97,6 @@ def test_fixed_voice_recognition():
         return False
     except Exception as e:
         print(f"\n💥 Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -6,10 +6,14 @@ Test the fixed workflow with better prompts and status checking
 import sys
 import os
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to Python path (once - repeat imports of these
+# test modules shouldn't stack duplicate entries)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from voice_to_suno_jbl import VoiceToSunoJBL
+# VoiceToSunoJBL is imported lazily inside the tests that need it - it
+# drags in speech_recognition/PyAudio, which costs seconds at startup
 
 def test_fixed_workflow():
     """Test the complete workflow with fixes."""
@@ -24,6 +28,7 @@ def test_fixed_workflow():
     try:
         # Initialize app
         print("🔧 Initializing app...")
+        from voice_to_suno_jbl import VoiceToSunoJBL
         app = VoiceToSunoJBL()
         print("✅ App initialized")
         
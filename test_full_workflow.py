@@ -5,12 +5,19 @@ Test the complete voice-to-Suno-to-JBL workflow with debugging
 
 import sys
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to Python path (once - repeat imports of these
+# test modules shouldn't stack duplicate entries)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from voice_to_suno_jbl import VoiceToSunoJBL
+# VoiceToSunoJBL is imported lazily inside the tests that need it - it
+# drags in speech_recognition/PyAudio, which costs seconds at startup,
+# and the menu should print before any of that loads
 
 def test_workflow_step_by_step():
     """Test each step of the workflow individually."""
@@ -20,17 +27,24 @@ def test_workflow_step_by_step():
     # Initialize the app
     try:
         print("🔧 Initializing VoiceToSunoJBL...")
+        from voice_to_suno_jbl import VoiceToSunoJBL
         app = VoiceToSunoJBL()
         print("✅ App initialized successfully!")
     except Exception as e:
         print(f"❌ App initialization failed: {e}")
         return False
     
-    # Step 1: Test JBL Connection
+    # Step 1: Test JBL Connection (with the Step 2 microphone warmup
+    # running alongside - sink selection and noise calibration are
+    # independent I/O, so setup costs max() of the two, not the sum)
     print("\n📍 STEP 1: Testing JBL Connection")
     print("-" * 40)
     try:
-        jbl_ok = app.set_jbl_as_default()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            jbl_future = executor.submit(app.set_jbl_as_default)
+            mic_future = executor.submit(app.prepare_microphone)
+            jbl_ok = jbl_future.result()
+            mic_future.result()
         if jbl_ok:
             print("✅ JBL set as default audio device")
         else:
@@ -84,22 +98,22 @@ def test_workflow_step_by_step():
         print(f"❌ Music generation error: {e}")
         return False
     
-    # Step 4: Wait for Music
-    print(f"\n📍 STEP 4: Waiting for Music Generation")
+    # Step 4: Wait for Music (polled in the background so the Step 5
+    # playback prompt can be answered during the 1-4 minute wait instead
+    # of after it)
+    print(f"\n📍 STEP 4: Waiting for Music Generation (in background)")
     print("-" * 40)
-    try:
-        tracks = app.wait_for_music(task_id)
-        if tracks:
-            print(f"✅ Music generation completed! Got {len(tracks)} track(s)")
-            for i, track in enumerate(tracks):
-                print(f"   Track {i+1}: {track['title']}")
-        else:
-            print("❌ Music generation timed out or failed")
-            return False
-    except Exception as e:
-        print(f"❌ Music waiting error: {e}")
-        return False
-    
+    poll_result = {}
+
+    def _poll_for_music():
+        try:
+            poll_result['tracks'] = app.wait_for_music(task_id)
+        except Exception as e:
+            poll_result['error'] = e
+
+    poll_thread = threading.Thread(target=_poll_for_music, daemon=True)
+    poll_thread.start()
+
     # Step 5: Test JBL Playback
     print(f"\n📍 STEP 5: Testing JBL Playback")
     print("-" * 40)
@@ -109,11 +123,28 @@ def test_workflow_step_by_step():
     print("   q - Quit")
     print("   ↑↓ - Volume")
     print()
-    
+
     input("Press Enter when ready to play music on JBL...")
-    
+
+    # Collect the background poll before touching the tracks
+    poll_thread.join()
+    if 'error' in poll_result:
+        print(f"❌ Music waiting error: {poll_result['error']}")
+        return False
+    tracks = poll_result.get('tracks')
+    if tracks:
+        print(f"✅ Music generation completed! Got {len(tracks)} track(s)")
+        for i, track in enumerate(tracks):
+            print(f"   Track {i+1}: {track['title']}")
+    else:
+        print("❌ Music generation timed out or failed")
+        return False
+
     try:
         for i, track in enumerate(tracks):
+            # Warm up the next track while this one plays
+            if i + 1 < len(tracks):
+                app._start_prefetch(tracks[i + 1])
             print(f"\n🎵 Playing track {i+1}/{len(tracks)}: {track['title']}")
             success = app.play_on_jbl(track)
             if success:
@@ -157,6 +188,7 @@ def test_continuous_mode():
         return
     
     try:
+        from voice_to_suno_jbl import VoiceToSunoJBL
         app = VoiceToSunoJBL()
         app.run_continuous()
     except KeyboardInterrupt:
@@ -172,6 +204,7 @@ def test_single_session():
     print()
     
     try:
+        from voice_to_suno_jbl import VoiceToSunoJBL
         app = VoiceToSunoJBL()
         success = app.run_voice_session()
         if success:
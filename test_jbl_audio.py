@@ -5,11 +5,22 @@ Test JBL speaker audio output
 
 import subprocess
 import sys
-import time
+
+# pulsectl keeps one PulseAudio socket open for the whole script instead
+# of paying fork+exec+handshake for every pactl command; pactl remains
+# the fallback when the binding isn't installed
+try:
+    import pulsectl
+except ImportError:
+    pulsectl = None
 
 JBL_DEVICE = "bluez_output.04_CB_88_B8_CF_72.1"
 
-def test_jbl_connection():
+def _find_jbl_sink(pulse):
+    """Look up the JBL sink object on an open pulsectl connection."""
+    return next((s for s in pulse.sink_list() if s.name == JBL_DEVICE), None)
+
+def test_jbl_connection(pulse=None):
     """Test JBL speaker connection and audio output."""
     print("🔊 Testing JBL Flip Essentials Connection")
     print("=" * 50)
@@ -17,42 +28,48 @@ def test_jbl_connection():
     # Check if JBL is available
     print("📡 Checking available audio devices...")
     try:
-        result = subprocess.run(['pactl', 'list', 'short', 'sinks'], 
-                              capture_output=True, text=True, check=True)
-        
-        print("Available audio sinks:")
-        for line in result.stdout.strip().split('\n'):
-            if line:
+        if pulse is not None:
+            sinks = {s.name: str(s.state) for s in pulse.sink_list()}
+        else:
+            result = subprocess.run(['pactl', 'list', 'short', 'sinks'],
+                                  capture_output=True, text=True, check=True)
+            sinks = {}
+            for line in result.stdout.strip().split('\n'):
                 parts = line.split('\t')
                 if len(parts) >= 2:
-                    device_id = parts[0]
-                    device_name = parts[1]
-                    status = parts[3] if len(parts) > 3 else "UNKNOWN"
-                    
-                    if JBL_DEVICE in device_name:
-                        print(f"  ✅ JBL Found: {device_name} (Status: {status})")
-                    else:
-                        print(f"  📱 {device_name} (Status: {status})")
-        
-        if JBL_DEVICE not in result.stdout:
+                    sinks[parts[1]] = parts[3] if len(parts) > 3 else "UNKNOWN"
+
+        print("Available audio sinks:")
+        for device_name, status in sinks.items():
+            if device_name == JBL_DEVICE:
+                print(f"  ✅ JBL Found: {device_name} (Status: {status})")
+            else:
+                print(f"  📱 {device_name} (Status: {status})")
+
+        # Exact O(1) membership - a substring scan could false-positive on
+        # an unrelated sink whose name embeds the JBL's
+        if JBL_DEVICE not in sinks:
             print("❌ JBL Flip Essentials not found!")
             print("💡 Make sure your JBL speaker is:")
             print("   - Powered on")
             print("   - Paired with your computer")
             print("   - Connected via Bluetooth")
             return False
-        
-    except subprocess.CalledProcessError as e:
+
+    except Exception as e:
         print(f"❌ Error checking audio devices: {e}")
         return False
-    
+
     # Set JBL as default
     print(f"\n🔧 Setting JBL as default audio output...")
     try:
-        subprocess.run(['pactl', 'set-default-sink', JBL_DEVICE], 
-                     check=True, capture_output=True)
+        if pulse is not None:
+            pulse.default_set(_find_jbl_sink(pulse))
+        else:
+            subprocess.run(['pactl', 'set-default-sink', JBL_DEVICE],
+                         check=True, capture_output=True)
         print("✅ JBL set as default audio output")
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"⚠️  Could not set JBL as default: {e}")
     
     # Test audio with existing stream
@@ -90,41 +107,53 @@ def test_jbl_connection():
         print(f"❌ Unexpected error: {e}")
         return False
 
-def test_volume_control():
+def test_volume_control(pulse=None):
     """Test volume control on JBL."""
     print(f"\n🔊 Testing volume control...")
-    
+
     volumes = [30, 50, 70, 90, 70]  # Test different volumes
-    
+
+    # No sleep between sets - the writes are applied synchronously and
+    # nothing is playing that would need audible verification
+    sink = _find_jbl_sink(pulse) if pulse is not None else None
+
     for vol in volumes:
         print(f"🔊 Setting volume to {vol}%...")
         try:
-            subprocess.run(['pactl', 'set-sink-volume', JBL_DEVICE, f'{vol}%'], 
-                         check=True, capture_output=True)
-            time.sleep(1)
-        except subprocess.CalledProcessError as e:
+            if sink is not None:
+                pulse.volume_set_all_chans(sink, vol / 100.0)
+            else:
+                subprocess.run(['pactl', 'set-sink-volume', JBL_DEVICE, f'{vol}%'],
+                             check=True, capture_output=True)
+        except Exception as e:
             print(f"⚠️  Volume control failed: {e}")
-    
+
     print("✅ Volume control test completed!")
 
 def main():
     """Main test function."""
+    # One PulseAudio connection shared by both tests when pulsectl is
+    # available - a single handshake instead of one per command
+    pulse = pulsectl.Pulse('jbl-test') if pulsectl else None
     try:
-        success = test_jbl_connection()
-        
+        success = test_jbl_connection(pulse)
+
         if success:
-            test_volume_control()
+            test_volume_control(pulse)
             print("\n🎉 JBL audio test completed successfully!")
             print("💡 Your JBL Flip Essentials is ready for voice-controlled music!")
         else:
             print("\n❌ JBL audio test failed")
             print("💡 Please check your Bluetooth connection and try again")
-            
+
     except KeyboardInterrupt:
         print("\n👋 Test cancelled")
     except Exception as e:
         print(f"\n💥 Error: {e}")
         sys.exit(1)
+    finally:
+        if pulse is not None:
+            pulse.close()
 
 if __name__ == "__main__":
     main()
@@ -3,8 +3,12 @@
 Test OpenAI API quota and permissions
 """
 
+import io
+import json
 import requests
 import os
+import wave
+from concurrent.futures import ThreadPoolExecutor
 
 # Load environment
 try:
@@ -13,141 +17,191 @@ try:
 except ImportError:
     pass
 
-def test_openai_api():
-    """Test OpenAI API access and quota."""
+def test_openai_api(api_keys=None):
+    """Test OpenAI API access and quota for one or more keys.
+
+    Defaults to the single key from OPENAI_API_KEY; pass a list to sweep
+    several (e.g. staging and prod) in one run. All keys are probed in
+    parallel on one connection pool, so the sweep costs about as much as
+    a single key.
+    """
     print("🔍 OpenAI API Quota & Permissions Test")
     print("=" * 50)
-    
-    api_key = os.getenv("OPENAI_API_KEY")
-    
-    if not api_key:
+
+    if api_keys is None:
+        env_key = os.getenv("OPENAI_API_KEY")
+        api_keys = [env_key] if env_key else []
+
+    if not api_keys:
         print("❌ No API key found")
         return False
-    
-    print(f"🔑 API Key: {'*' * 8}{api_key[-4:]}")
-    
-    # Test 1: Check API key validity
-    print("\n1️⃣ Testing API key validity...")
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json'
-    }
-    
+
+    # One session shared by every probe of every key - TCP+TLS to
+    # api.openai.com is set up once and kept alive instead of
+    # re-handshaking per request. Auth goes in per-request headers since
+    # the keys differ.
+    session = requests.Session()
+    session.headers.update({'Content-Type': 'application/json'})
+    wav_bytes = _make_silent_wav()
+
     try:
-        # Test with models endpoint (lightweight)
-        response = requests.get(
+        with ThreadPoolExecutor(max_workers=min(len(api_keys), 4)) as executor:
+            futures = [executor.submit(_probe_key, session, key, wav_bytes)
+                       for key in api_keys]
+
+        all_ok = True
+        for key, future in zip(api_keys, futures):
+            ok, report = future.result()
+            print(f"\n🔑 API Key: {'*' * 8}{key[-4:]}")
+            print(report)
+            all_ok = all_ok and ok
+        return all_ok
+    finally:
+        session.close()
+
+def _probe_key(session, api_key, wav_bytes):
+    """Run the three diagnostic probes for one key, concurrently.
+
+    The probes are independent read-only calls, so total latency is the
+    slowest one instead of the sum. Returns (success, report text).
+    """
+    auth = {'Authorization': f'Bearer {api_key}'}
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        models_future = executor.submit(_probe_models, session, auth)
+        usage_future = executor.submit(_probe_usage, session, auth)
+        whisper_future = executor.submit(_probe_whisper, session, auth, wav_bytes)
+
+    key_ok, models_lines = models_future.result()
+    _, usage_lines = usage_future.result()
+    whisper_ok, whisper_lines = whisper_future.result()
+
+    report = "\n".join([
+        "1️⃣ Testing API key validity...", *models_lines,
+        "", "2️⃣ Testing account access...", *usage_lines,
+        "", "3️⃣ Testing Whisper API access...", *whisper_lines,
+    ])
+    return key_ok and whisper_ok, report
+
+def _make_silent_wav():
+    """Build one second of silent 16 kHz mono WAV for the Whisper probe.
+
+    Assembled entirely in memory - a 32 KB buffer of zeros doesn't need a
+    temp file on disk, the reopen, or the unlink cleanup.
+    """
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as wav_file:
+        wav_file.setnchannels(1)  # Mono
+        wav_file.setsampwidth(2)  # 16-bit
+        wav_file.setframerate(16000)  # 16kHz
+        wav_file.writeframes(b'\x00' * 32000)  # 1 second of silence
+    return buf.getvalue()
+
+def _probe_models(session, auth):
+    """Check API key validity via the lightweight models endpoint."""
+    lines = []
+    try:
+        response = session.get(
             'https://api.openai.com/v1/models',
-            headers=headers,
+            headers=auth,
             timeout=10
         )
-        
-        print(f"   Status: {response.status_code}")
-        
+
+        lines.append(f"   Status: {response.status_code}")
+
         if response.status_code == 200:
-            print("   ✅ API key is valid")
-            models = response.json()
+            lines.append("   ✅ API key is valid")
+            models = json.loads(response.content)
             whisper_models = [m for m in models['data'] if 'whisper' in m['id']]
-            print(f"   🎤 Whisper models available: {len(whisper_models)}")
+            lines.append(f"   🎤 Whisper models available: {len(whisper_models)}")
+            return True, lines
         elif response.status_code == 401:
-            print("   ❌ API key is invalid")
-            return False
+            lines.append("   ❌ API key is invalid")
+            return False, lines
         elif response.status_code == 429:
-            print("   ⚠️  Rate limited or quota exceeded")
-            print(f"   Response: {response.text}")
+            lines.append("   ⚠️  Rate limited or quota exceeded")
+            lines.append(f"   Response: {response.text}")
+            return True, lines
         else:
-            print(f"   ❌ Error: {response.status_code}")
-            print(f"   Response: {response.text}")
-            
+            lines.append(f"   ❌ Error: {response.status_code}")
+            lines.append(f"   Response: {response.text}")
+            return False, lines
+
     except Exception as e:
-        print(f"   ❌ Request failed: {e}")
-        return False
-    
-    # Test 2: Check account usage/billing
-    print("\n2️⃣ Testing account access...")
+        lines.append(f"   ❌ Request failed: {e}")
+        return False, lines
+
+def _probe_usage(session, auth):
+    """Check account usage/billing access."""
+    lines = []
     try:
-        # This endpoint shows usage info
-        response = requests.get(
+        response = session.get(
             'https://api.openai.com/v1/usage?date=2024-01-28',
-            headers=headers,
+            headers=auth,
             timeout=10
         )
-        
-        print(f"   Status: {response.status_code}")
-        
+
+        lines.append(f"   Status: {response.status_code}")
+
         if response.status_code == 200:
-            print("   ✅ Account access working")
+            lines.append("   ✅ Account access working")
         elif response.status_code == 403:
-            print("   ⚠️  Account access restricted")
-            print("   💡 May need to add payment method")
+            lines.append("   ⚠️  Account access restricted")
+            lines.append("   💡 May need to add payment method")
         else:
-            print(f"   Response: {response.text[:200]}")
-            
+            lines.append(f"   Response: {response.text[:200]}")
+        return True, lines
+
     except Exception as e:
-        print(f"   ❌ Usage check failed: {e}")
-    
-    # Test 3: Try a minimal Whisper request
-    print("\n3️⃣ Testing Whisper API access...")
-    
-    # Create a tiny test audio file (silence)
-    import tempfile
-    import wave
-    
+        lines.append(f"   ❌ Usage check failed: {e}")
+        return False, lines
+
+def _probe_whisper(session, auth, wav_bytes):
+    """Try a minimal Whisper transcription with the silent WAV."""
+    lines = []
     try:
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_path = temp_file.name
-        
-        # Create 1 second of silence
-        with wave.open(temp_path, 'wb') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(16000)  # 16kHz
-            wav_file.writeframes(b'\x00' * 32000)  # 1 second of silence
-        
-        # Test Whisper API
-        with open(temp_path, 'rb') as audio_file:
-            files = {
-                'file': ('test.wav', audio_file, 'audio/wav'),
-                'model': (None, 'whisper-1')
-            }
-            
-            response = requests.post(
-                'https://api.openai.com/v1/audio/transcriptions',
-                headers={'Authorization': f'Bearer {api_key}'},
-                files=files,
-                timeout=30
-            )
-        
-        # Clean up
-        os.unlink(temp_path)
-        
-        print(f"   Status: {response.status_code}")
-        
+        files = {
+            'file': ('test.wav', wav_bytes, 'audio/wav'),
+            'model': (None, 'whisper-1')
+        }
+
+        # Content-Type must be dropped so requests can set the
+        # multipart boundary itself
+        response = session.post(
+            'https://api.openai.com/v1/audio/transcriptions',
+            headers={**auth, 'Content-Type': None},
+            files=files,
+            timeout=30
+        )
+
+        lines.append(f"   Status: {response.status_code}")
+
         if response.status_code == 200:
-            print("   ✅ Whisper API working!")
-            result = response.json()
-            print(f"   Result: {result.get('text', 'No text')}")
-            return True
+            lines.append("   ✅ Whisper API working!")
+            result = json.loads(response.content)
+            lines.append(f"   Result: {result.get('text', 'No text')}")
+            return True, lines
         elif response.status_code == 429:
-            print("   ❌ Quota exceeded")
-            error_data = response.json()
-            print(f"   Error: {error_data.get('error', {}).get('message', 'Unknown')}")
-            
+            lines.append("   ❌ Quota exceeded")
+            error_data = json.loads(response.content)
+            lines.append(f"   Error: {error_data.get('error', {}).get('message', 'Unknown')}")
+
             # Check error details
             error_type = error_data.get('error', {}).get('type')
             if error_type == 'insufficient_quota':
-                print("   💡 Solutions:")
-                print("      1. Add payment method: https://platform.openai.com/account/billing")
-                print("      2. Check usage: https://platform.openai.com/usage")
-                print("      3. Wait if rate limited")
-            
-            return False
+                lines.append("   💡 Solutions:")
+                lines.append("      1. Add payment method: https://platform.openai.com/account/billing")
+                lines.append("      2. Check usage: https://platform.openai.com/usage")
+                lines.append("      3. Wait if rate limited")
+
+            return False, lines
         else:
-            print(f"   ❌ Error: {response.text}")
-            return False
-            
+            lines.append(f"   ❌ Error: {response.text}")
+            return False, lines
+
     except Exception as e:
-        print(f"   ❌ Whisper test failed: {e}")
-        return False
+        lines.append(f"   ❌ Whisper test failed: {e}")
+        return False, lines
 
 def main():
     """Main test function."""
@@ -155,9 +209,9 @@ def main():
     print("=" * 40)
     print("This will test your OpenAI API access and identify quota issues.")
     print()
-    
+
     success = test_openai_api()
-    
+
     print("\n📋 Summary:")
     if success:
         print("✅ OpenAI Whisper API is working!")
@@ -5,7 +5,18 @@ Test and compare different speech recognition services
 
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Per-provider caps on in-flight requests. One recording only issues one
+# call per provider today, but anything that loops (multiple clips, key
+# sweeps) would otherwise fan out unbounded and trip HTTP 429 rate limits.
+_SERVICE_LIMITS = {
+    'google': threading.Semaphore(5),
+    'whisper': threading.Semaphore(2),
+    'deepgram': threading.Semaphore(3),
+}
 
 # Add current directory to path
 sys.path.insert(0, '.')
@@ -69,87 +80,110 @@ def test_speech_services():
     print("✅ Recording complete!")
     print()
     
-    # Test each service
-    results = {}
-    
-    for service_id, name, available in available_services:
-        if not available:
-            continue
-            
-        print(f"🔄 Testing {name}...")
-        start_time = time.time()
-        
+    # Encode the recording once; every provider uploads the same buffer
+    # instead of re-running the WAV encode per call
+    wav_bytes = audio.get_wav_data(convert_rate=16000, convert_width=2)
+
+    # One app shared by every worker - each service call is pure network I/O
+    from voice_to_suno_jbl import VoiceToSunoJBL
+    app = VoiceToSunoJBL()
+
+    def test_one_service(service_id, name):
+        """Run one provider against the shared recording, with timing."""
+        start_time = time.monotonic()
         try:
-            # Temporarily set the service
-            original_service = os.environ.get('SPEECH_SERVICE', 'google')
-            os.environ['SPEECH_SERVICE'] = service_id
-            
-            # Import and test
-            from voice_to_suno_jbl import VoiceToSunoJBL
-            app = VoiceToSunoJBL()
-            
-            # Process the audio
-            result = app.process_audio_with_service(audio)
-            
-            # Restore original service
-            os.environ['SPEECH_SERVICE'] = original_service
-            
-            end_time = time.time()
-            processing_time = end_time - start_time
-            
-            results[service_id] = {
+            with _SERVICE_LIMITS.get(service_id, threading.Semaphore(1)):
+                result = app.process_audio_with_service(audio, service=service_id,
+                                                        wav_bytes=wav_bytes)
+            return {
                 'name': name,
                 'result': result,
-                'time': processing_time,
+                'time': time.monotonic() - start_time,
                 'success': bool(result)
             }
-            
-            if result:
-                print(f"   ✅ Result: '{result}'")
-                print(f"   ⏱️  Time: {processing_time:.1f}s")
-            else:
-                print(f"   ❌ Failed to recognize")
-                
         except Exception as e:
-            print(f"   ❌ Error: {e}")
-            results[service_id] = {
+            return {
                 'name': name,
                 'result': None,
                 'time': 0,
                 'success': False,
                 'error': str(e)
             }
-        
+
+    # Fan the providers out concurrently - each call is an independent HTTP
+    # round-trip, so total wall time is max(latency) instead of the sum
+    print(f"🔄 Testing {len(available_services)} service(s) in parallel...")
+    with ThreadPoolExecutor(max_workers=len(available_services)) as executor:
+        futures = {
+            service_id: executor.submit(test_one_service, service_id, name)
+            for service_id, name, _ in available_services
+        }
+
+    results = {}
+    for service_id, future in futures.items():
+        data = future.result()
+        results[service_id] = data
+
+        print(f"🔄 {data['name']}:")
+        if data['success']:
+            print(f"   ✅ Result: '{data['result']}'")
+            print(f"   ⏱️  Time: {data['time']:.1f}s")
+        elif 'error' in data:
+            print(f"   ❌ Error: {data['error']}")
+        else:
+            print(f"   ❌ Failed to recognize")
         print()
-    
+
     # Show comparison
     show_results_comparison(results)
 
+# Shared recognizer/microphone and the time of the last noise calibration.
+# Calibrating costs a full second, so repeat recordings within the TTL skip
+# it and reuse the cached energy threshold.
+_recognizer = None
+_microphone = None
+_last_calibrated_at = 0.0
+_CAL_TTL = 60.0  # seconds
+
 def record_audio():
     """Record audio for testing."""
+    global _recognizer, _microphone, _last_calibrated_at
     try:
         import speech_recognition as sr
-        
-        recognizer = sr.Recognizer()
-        microphone = sr.Microphone()
-        
-        # Quick calibration
-        with microphone as source:
-            recognizer.adjust_for_ambient_noise(source, duration=1)
-        
+
+        if _recognizer is None:
+            _recognizer = sr.Recognizer()
+            _microphone = sr.Microphone()
+        recognizer = _recognizer
+        microphone = _microphone
+
+        # Quick calibration (skipped while a recent one is still fresh)
+        if time.monotonic() - _last_calibrated_at > _CAL_TTL:
+            with microphone as source:
+                recognizer.adjust_for_ambient_noise(source, duration=1)
+            _last_calibrated_at = time.monotonic()
+
         # Countdown
         for i in range(3, 0, -1):
             print(f"Starting in {i}...")
             time.sleep(1)
         
         print("🔴 Recording 10 seconds - speak now!")
-        
-        # Record
+
+        # Record in 2-second windows instead of one blocking 10s call.
+        # The source stays open so there are no gaps; frames are stitched
+        # back into a single clip. The loop gives per-window progress and
+        # is the seam where chunks could be handed to a streaming
+        # recognizer as they arrive.
+        chunks = []
         with microphone as source:
-            audio = recognizer.record(source, duration=10)
-        
+            for i in range(5):
+                chunks.append(recognizer.record(source, duration=2))
+                print(f"   ...{(i + 1) * 2}s captured", flush=True)
+
         print("⏹️  Recording stopped")
-        return audio
+        frames = b''.join(chunk.frame_data for chunk in chunks)
+        return sr.AudioData(frames, chunks[0].sample_rate, chunks[0].sample_width)
         
     except Exception as e:
         print(f"❌ Recording error: {e}")
@@ -3,8 +3,18 @@
 Quick test of stream player with existing Suno track
 """
 
+import shutil
 import subprocess
 import sys
+from functools import lru_cache
+
+# Banner rule built once at import instead of per print call
+_BAR40 = "=" * 40
+
+@lru_cache(maxsize=None)
+def _find_player(name):
+    """Locate a player binary with a PATH walk instead of spawning it."""
+    return shutil.which(name)
 
 def test_stream_playback():
     """Test streaming playback with existing track."""
@@ -14,82 +24,93 @@ def test_stream_playback():
     title = "Sunshine in My Pocket"
     
     print("🎵 Testing Suno Stream Playback")
-    print("=" * 40)
+    print(_BAR40)
     print(f"🎵 Track: {title}")
     print(f"🔗 Stream URL: {stream_url[:50]}...")
     print()
     
-    # Find available player
+    # Find available player. Each command carries explicit small-buffer
+    # flags - the players default to seconds of network readahead, which
+    # delays first audio out of the speaker by the same amount.
     players = [
         ('mpv', [
             'mpv', stream_url,
             f'--title=Suno: {title}',
             '--no-video',
             '--volume=70',
-            '--osd-level=2'
+            '--osd-level=2',
+            '--cache-secs=0.5',
+            '--demuxer-readahead-secs=0.5',
+            '--network-timeout=5'
         ]),
         ('vlc', [
             'vlc', stream_url,
             '--intf', 'ncurses',
             '--no-video',
-            '--volume', '70'
+            '--volume', '70',
+            '--network-caching', '300',
+            '--file-caching', '300'
         ]),
         ('mplayer', [
             'mplayer', stream_url,
             '-volume', '70',
-            '-title', f'Suno: {title}'
+            '-title', f'Suno: {title}',
+            '-cache', '256',
+            '-cache-min', '5'
         ]),
         ('ffplay', [
             'ffplay', stream_url,
             '-nodisp',
-            '-volume', '70'
+            '-volume', '70',
+            '-fflags', 'nobuffer',
+            '-flags', 'low_delay',
+            '-probesize', '32',
+            '-analyzeduration', '0'
         ])
     ]
     
-    for player_name, command in players:
-        try:
-            # Test if player is available
-            subprocess.run([player_name, '--version'], 
-                         capture_output=True, timeout=5)
-            
-            print(f"✅ Using {player_name} player")
-            print()
-            print("🎮 PLAYBACK CONTROLS:")
-            if player_name == 'mpv':
-                print("  SPACE - Play/Pause")
-                print("  ← → - Seek backward/forward")
-                print("  ↑ ↓ - Volume up/down")
-                print("  q - Quit")
-                print("  m - Mute/Unmute")
-            elif player_name == 'vlc':
-                print("  SPACE - Play/Pause")
-                print("  Ctrl+← → - Seek")
-                print("  Ctrl+↑ ↓ - Volume")
-                print("  q - Quit")
-            else:
-                print("  SPACE - Play/Pause")
-                print("  ← → - Seek")
-                print("  ↑ ↓ - Volume")
-                print("  q - Quit")
-            
-            print()
-            print("▶️  Starting playback...")
-            print()
-            
-            # Start playback
-            subprocess.run(command)
-            
-            print()
-            print("✅ Playback completed!")
-            return True
-            
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
-            continue
-    
-    print("❌ No compatible audio player found!")
-    print("💡 Please install one of: mpv, vlc, mplayer, or ffplay")
-    print(f"🔗 Direct stream URL: {stream_url}")
-    return False
+    # Prescan for the first installed player - a PATH lookup per name,
+    # with no player forked just to probe for it
+    available = next(
+        ((name, cmd) for name, cmd in players if _find_player(name)), None)
+
+    if available is None:
+        print("❌ No compatible audio player found!")
+        print("💡 Please install one of: mpv, vlc, mplayer, or ffplay")
+        print(f"🔗 Direct stream URL: {stream_url}")
+        return False
+
+    player_name, command = available
+    print(f"✅ Using {player_name} player")
+    print()
+    print("🎮 PLAYBACK CONTROLS:")
+    if player_name == 'mpv':
+        print("  SPACE - Play/Pause")
+        print("  ← → - Seek backward/forward")
+        print("  ↑ ↓ - Volume up/down")
+        print("  q - Quit")
+        print("  m - Mute/Unmute")
+    elif player_name == 'vlc':
+        print("  SPACE - Play/Pause")
+        print("  Ctrl+← → - Seek")
+        print("  Ctrl+↑ ↓ - Volume")
+        print("  q - Quit")
+    else:
+        print("  SPACE - Play/Pause")
+        print("  ← → - Seek")
+        print("  ↑ ↓ - Volume")
+        print("  q - Quit")
+
+    print()
+    print("▶️  Starting playback...")
+    print()
+
+    # Start playback
+    subprocess.run(command)
+
+    print()
+    print("✅ Playback completed!")
+    return True
 
 def main():
     """Main function."""
@@ -1,66 +1,106 @@
 #!/usr/bin/env python3
 """Test script for Suno POC functionality."""
 
+from __future__ import annotations
+
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from voice2suno import config, SunoClient
-from rich.console import Console
+# voice2suno and rich are imported lazily inside the functions that use
+# them - collection/import of this module then touches only the stdlib
+# (rich alone drags in pygments)
+
+# Banner rule built once at import instead of per print call
+_BAR50 = "=" * 50
+
+
+@lru_cache(maxsize=1)
+def _console():
+    from rich.console import Console
+    return Console()
+
 
-console = Console()
+@lru_cache(maxsize=1)
+def get_client():
+    """One SunoClient per process.
+
+    Construction sets up the HTTPS session and validates the cookie, so
+    every caller shares this instance instead of re-paying that.
+    """
+    from voice2suno import SunoClient
+    return SunoClient()
 
 
 def test_config():
     """Test configuration loading."""
-    console.print("🔧 Testing configuration...", style="blue")
-    
-    console.print(f"Suno Cookie: {'✅ Set' if config.suno_cookie else '❌ Missing'}")
-    console.print(f"Model Version: {config.suno_model_version}")
-    console.print(f"Output Dir: {config.output_dir}")
-    console.print(f"Downloads Dir: {config.downloads_dir}")
-    
-    if not config.validate():
-        console.print("❌ Configuration validation failed", style="red")
-        missing = config.get_missing_config()
-        console.print(f"Missing: {', '.join(missing)}", style="yellow")
-        return False
-    
-    console.print("✅ Configuration is valid", style="green")
-    return True
+    from voice2suno import config
+
+    # The whole report is rendered into one buffer and flushed with a
+    # single stdout write, instead of a write per console.print
+    console = _console()
+    with console.capture() as cap:
+        console.print("🔧 Testing configuration...", style="blue")
+
+        console.print(f"Suno Cookie: {'✅ Set' if config.suno_cookie else '❌ Missing'}")
+        console.print(f"Model Version: {config.suno_model_version}")
+        console.print(f"Output Dir: {config.output_dir}")
+        console.print(f"Downloads Dir: {config.downloads_dir}")
+
+        valid = config.validate()
+        if valid:
+            console.print("✅ Configuration is valid", style="green")
+        else:
+            console.print("❌ Configuration validation failed", style="red")
+            missing = config.get_missing_config()
+            console.print(f"Missing: {', '.join(missing)}", style="yellow")
+
+    sys.stdout.write(cap.get())
+    return valid
 
 
 def test_client_initialization():
     """Test Suno client initialization."""
-    console.print("\n🎵 Testing Suno client initialization...", style="blue")
-    
-    try:
-        client = SunoClient()
-        console.print("✅ Suno client initialized successfully", style="green")
-        return client
-    except Exception as e:
-        console.print(f"❌ Failed to initialize client: {e}", style="red")
-        return None
+    console = _console()
+    with console.capture() as cap:
+        console.print("\n🎵 Testing Suno client initialization...", style="blue")
+
+        try:
+            client = get_client()
+            console.print("✅ Suno client initialized successfully", style="green")
+        except Exception as e:
+            client = None
+            console.print(f"❌ Failed to initialize client: {e}", style="red")
+
+    sys.stdout.write(cap.get())
+    return client
 
 
 def test_credits(client: SunoClient):
     """Test credits retrieval."""
-    console.print("\n💳 Testing credits retrieval...", style="blue")
-    
-    try:
-        credits = client.get_credits_info()
-        console.print(f"✅ Credits info retrieved successfully", style="green")
-        return True
-    except Exception as e:
-        console.print(f"❌ Failed to get credits: {e}", style="red")
-        return False
+    console = _console()
+    with console.capture() as cap:
+        console.print("\n💳 Testing credits retrieval...", style="blue")
+
+        try:
+            client.get_credits_info()
+            ok = True
+            console.print(f"✅ Credits info retrieved successfully", style="green")
+        except Exception as e:
+            ok = False
+            console.print(f"❌ Failed to get credits: {e}", style="red")
+
+    sys.stdout.write(cap.get())
+    return ok
 
 
 def test_simple_generation(client: SunoClient):
     """Test simple music generation."""
+    console = _console()
     console.print("\n🎶 Testing simple music generation...", style="blue")
     
     test_prompt = "A peaceful acoustic guitar melody with soft vocals about a sunny day"
@@ -93,6 +133,7 @@ def test_simple_generation(client: SunoClient):
 
 def test_download(client: SunoClient, clips):
     """Test song download."""
+    console = _console()
     console.print("\n📥 Testing song download...", style="blue")
     
     if not clips:
@@ -116,15 +157,26 @@ def test_download(client: SunoClient, clips):
 
 def main():
     """Run all tests."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    console = _console()
     console.print("🧪 Suno POC Test Suite", style="bold magenta")
-    console.print("=" * 50)
-    
-    # Test 1: Configuration
-    if not test_config():
-        console.print("\n❌ Configuration test failed. Please set up your environment.", style="red")
-        console.print("Create a .env file with: SUNO_COOKIE=your_cookie_here", style="yellow")
-        return False
-    
+    console.print(_BAR50)
+
+    # Warm the client on a worker thread while the configuration test
+    # prints - touching .client forces the lazy Suno construction, so
+    # its session setup and cookie validation overlap the checks instead
+    # of following them. get_client's cache makes the later call in
+    # test_client_initialization an instant hit.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pool.submit(lambda: get_client().client)
+
+        # Test 1: Configuration
+        if not test_config():
+            console.print("\n❌ Configuration test failed. Please set up your environment.", style="red")
+            console.print("Create a .env file with: SUNO_COOKIE=your_cookie_here", style="yellow")
+            return False
+
     # Test 2: Client initialization
     client = test_client_initialization()
     if not client:
@@ -149,8 +201,8 @@ if __name__ == "__main__":
         success = main()
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
-        console.print("\n👋 Test interrupted by user", style="yellow")
+        _console().print("\n👋 Test interrupted by user", style="yellow")
         sys.exit(1)
     except Exception as e:
-        console.print(f"\n💥 Unexpected error: {e}", style="red")
+        _console().print(f"\n💥 Unexpected error: {e}", style="red")
         sys.exit(1)
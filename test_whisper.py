@@ -5,31 +5,55 @@ Test OpenAI Whisper speech recognition
 
 import os
 import sys
+import types
 
 # Add current directory to path
 sys.path.insert(0, '.')
 
+def _snapshot_env():
+    """Read the relevant environment variables exactly once.
+
+    dotenv parsing and getenv lookups happen here; everything downstream
+    works from the returned snapshot.
+    """
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+        loaded = True
+    except ImportError:
+        loaded = False
+    return types.SimpleNamespace(
+        dotenv_loaded=loaded,
+        openai_key=os.getenv("OPENAI_API_KEY"),
+        speech_service=os.getenv("SPEECH_SERVICE", "google"),
+    )
+
+_ENV = _snapshot_env()
+
+# Banner rules built once at import instead of per print call
+_BAR30 = "=" * 30
+_BAR40 = "=" * 40
+_BAR50 = "=" * 50
+_BAR60 = "=" * 60
+
 def test_whisper_setup():
     """Test OpenAI Whisper setup and configuration."""
     print("🎤 OpenAI Whisper Speech Recognition Test")
-    print("=" * 60)
+    print(_BAR60)
     
     # Check environment variables
     print("🔧 Checking configuration...")
     
-    # Load environment
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
+    # Environment was snapshotted once at import time
+    if _ENV.dotenv_loaded:
         print("✅ Environment loaded")
-    except ImportError:
+    else:
         print("⚠️  python-dotenv not installed (optional)")
-    
+
     # Check API key
-    openai_key = os.getenv("OPENAI_API_KEY")
-    speech_service = os.getenv("SPEECH_SERVICE", "google")
-    
-    print(f"📋 Speech service: {speech_service}")
+    openai_key = _ENV.openai_key
+
+    print(f"📋 Speech service: {_ENV.speech_service}")
     
     if openai_key:
         if openai_key.startswith("sk-") and len(openai_key) > 20:
@@ -63,7 +87,7 @@ def test_whisper_setup():
         
         # Test voice recognition
         print("🎤 Voice Recognition Test")
-        print("=" * 30)
+        print(_BAR30)
         print("💡 When prompted, say something like:")
         print("   'Create upbeat electronic music'")
         print("   'Generate a jazz piano melody'")
@@ -118,7 +142,7 @@ def test_whisper_setup():
 def show_whisper_info():
     """Show information about OpenAI Whisper."""
     print("\n🎯 OpenAI Whisper Information")
-    print("=" * 40)
+    print(_BAR40)
     print("✅ Advantages:")
     print("   - Excellent accuracy (90%+ vs 60-70% Google)")
     print("   - Handles accents and background noise")
@@ -139,7 +163,7 @@ def show_whisper_info():
 def main():
     """Main test function."""
     print("🎤 OpenAI Whisper Setup & Test")
-    print("=" * 50)
+    print(_BAR50)
     
     try:
         success = test_whisper_setup()
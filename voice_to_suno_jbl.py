@@ -5,15 +5,20 @@ Listen for voice commands → Generate music with Suno → Play on JBL speaker
 """
 
 import speech_recognition as sr
+import numpy as np
 import requests
+import hashlib
 import json
+import re
+import socket
 import time
 import subprocess
 import sys
 import os
 import threading
 import tempfile
-import wave
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List
 
 # Load environment variables
@@ -23,18 +28,77 @@ try:
 except ImportError:
     pass  # dotenv is optional
 
+# On-device Whisper is optional: with faster-whisper installed,
+# transcription runs locally (CTranslate2 int8) and the per-utterance
+# cloud round-trip disappears entirely
+try:
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+except ImportError:
+    WhisperModel = None
+    BatchedInferencePipeline = None
+
 # Configuration
 API_KEY = "4e2feeb494648a5f5845dd5b65558544"
 BASE_URL = "https://apibox.erweima.ai"
 JBL_DEVICE = "bluez_output.04_CB_88_B8_CF_72.1"  # Your JBL Flip Essentials
+MPV_IPC_SOCKET = "/tmp/mpv-jbl.sock"  # JSON IPC endpoint for the persistent player
+
+# Words Suno's filter sometimes bounces with SENSITIVE_WORD_ERROR. The
+# precompiled word-boundary pattern (compiled once at import, single
+# automaton pass per prompt) powers an advance warning only - the API
+# is the authority on what it accepts, so the prompt is always sent.
+SENSITIVE_WORDS = [
+    'kill', 'murder', 'suicide', 'terrorist', 'nazi', 'drugs', 'sex',
+]
+_SENSITIVE_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, SENSITIVE_WORDS)) + r')\b', re.IGNORECASE)
+
+# The status lines speak_status announces every session. Synthesized to
+# WAV once per process so announcements replay a file instead of paying
+# espeak's fork+synth (~100-300ms) each time.
+_CANNED_STATUS = (
+    "Generating your music, please wait",
+    "Your music is ready",
+    "Music generation failed",
+    "Music generation timed out",
+)
 
 # Speech Recognition Configuration
 SPEECH_SERVICE = "whisper"  # Options: "google", "whisper", "deepgram", "azure"
+# On-device Whisper tuning. int8 halves the bytes moved per inference and
+# uses VNNI dot products where the CPU has them, at <1% WER cost for
+# small.en; int8_float16 is the equivalent sweet spot on CUDA.
+WHISPER_MODEL = os.getenv("WHISPER_MODEL", "small.en")
+WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "auto")
+WHISPER_COMPUTE = os.getenv("WHISPER_COMPUTE", "int8")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # Set this for Whisper API
 DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")  # Set this for Deepgram
 AZURE_SPEECH_KEY = os.getenv("AZURE_SPEECH_KEY")  # Set this for Azure Speech
 
+def _to_f32(pcm_bytes: bytes):
+    """Convert int16 PCM bytes to a float32 array in [-1, 1].
+
+    One zero-copy frombuffer view plus a vectorized cast-and-scale -
+    the whole conversion runs in numpy's SIMD loops, never sample by
+    sample in the interpreter.
+    """
+    return (np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32)
+            * np.float32(1.0 / 32768.0))
+
+
 class VoiceToSunoJBL:
+    # Per-color format strings built once at class creation: log() is a
+    # dict get plus one % substitution, with no ANSI concatenation or
+    # second lookup per call - it runs inside the poll loop
+    _LOG_TEMPLATES = {
+        "blue": "\033[0;34m%s\033[0m",
+        "green": "\033[0;32m%s\033[0m",
+        "yellow": "\033[1;33m%s\033[0m",
+        "red": "\033[0;31m%s\033[0m",
+        "cyan": "\033[0;36m%s\033[0m",
+        "magenta": "\033[0;35m%s\033[0m",
+    }
+
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
@@ -43,9 +107,66 @@ class VoiceToSunoJBL:
             'User-Agent': 'VoiceToSunoJBL/1.0'
         })
         
-        # Initialize speech recognition
+        # Keep-alive session shared by the cloud STT providers - later
+        # utterances reuse the pooled TLS connection instead of paying
+        # the handshake again. Auth headers go per request because
+        # OpenAI and Deepgram authenticate differently.
+        self._stt_session = requests.Session()
+
+        # Next-track prefetch: while one track plays, the following one
+        # streams to a temp file in the background so there's no silent
+        # buffering gap between tracks
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._prefetch_futures: Dict[str, object] = {}
+
+        # Persistent mpv player, spawned lazily on first playback. Keeping
+        # one process alive avoids re-paying codec init and the Bluetooth
+        # A2DP sink open (200+ ms) for every track.
+        self._mpv_proc = None
+        self._mpv_sock = None
+
+        # Quiet mode drops the per-poll progress chatter in
+        # wait_for_music; errors and results still print
+        self.verbose = True
+
+        # Canned TTS lines, synthesized off the critical path
+        self._tts: Dict[str, str] = {}
+        threading.Thread(target=self._prepare_tts, daemon=True).start()
+
+        # Last JBL sink check (monotonic time, result) - see _jbl_ready
+        self._jbl_last_check = 0.0
+        self._jbl_last_ok = False
+
+        # Recent transcripts keyed on a digest of the raw PCM: an exact
+        # replay of an utterance (same recording fed through twice)
+        # returns the cached text instead of re-running the decode or
+        # API call. LRU, capacity 32.
+        self._stt_cache: OrderedDict = OrderedDict()
+
+        # On-device Whisper pipeline. When it will be needed, a warmup
+        # thread loads the model and runs one silent inference during
+        # startup, so the first real session doesn't pay the load +
+        # first-run cost inside its recording window. _local_whisper()
+        # waits on the event instead of racing the warmup.
+        self._wm_batched = None
+        self._wm_ready = threading.Event()
+        if WhisperModel is not None and SPEECH_SERVICE == "whisper":
+            threading.Thread(target=self._warmup_whisper, daemon=True).start()
+        else:
+            self._wm_ready.set()
+
+        # Last status response per task: task_id -> (body digest, parsed
+        # JSON). Polling returns byte-identical bodies for most of a
+        # generation, so an unchanged digest skips the re-parse.
+        self._status_cache: Dict[str, tuple] = {}
+
+        # Initialize speech recognition. The 4x-default capture buffer
+        # quarters the read pressure on the PortAudio callback, so GIL
+        # contention from the decode/warmup threads is far less likely
+        # to show up as ALSA overruns (distorted audio, failed STT,
+        # re-records).
         self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        self.microphone = sr.Microphone(chunk_size=4096)
         
         # Adjust for ambient noise and speech recognition settings
         print("🎤 Calibrating microphone for ambient noise...")
@@ -60,22 +181,19 @@ class VoiceToSunoJBL:
         print("✅ Microphone calibrated!")
     
     def log(self, message: str, color: str = "blue"):
-        colors = {
-            "blue": "\033[0;34m",
-            "green": "\033[0;32m", 
-            "yellow": "\033[1;33m",
-            "red": "\033[0;31m",
-            "cyan": "\033[0;36m",
-            "magenta": "\033[0;35m",
-            "reset": "\033[0m"
-        }
-        print(f"{colors.get(color, '')}{message}{colors['reset']}")
+        print(self._LOG_TEMPLATES.get(color, "%s") % message)
     
+    def prepare_microphone(self):
+        """Refresh the ambient-noise calibration.
+
+        Safe to run on a worker thread so callers can overlap the ~1s
+        warmup with other setup (e.g. selecting the JBL sink).
+        """
+        with self.microphone as source:
+            self.recognizer.adjust_for_ambient_noise(source, duration=1)
+
     def listen_for_voice_command(self) -> Optional[str]:
         """Listen for voice input and convert to text with visual countdown."""
-        import threading
-        import time
-
         self.log("🎤 Get ready to speak your music request!", "cyan")
         self.log("💡 Example: 'upbeat rock music' or 'jazz melody'", "cyan")
 
@@ -85,68 +203,199 @@ class VoiceToSunoJBL:
             time.sleep(1)
         print(f"\r🎤 SPEAK NOW! Recording for 10 seconds...                    ")
 
-        # Variables for countdown
-        listening = True
-        start_time = time.time()
         record_seconds = 10
 
-        def countdown_timer():
-            """Show countdown timer while listening."""
-            while listening:
-                elapsed = time.time() - start_time
-                remaining = max(0, record_seconds - elapsed)
-
-                if remaining > 0:
-                    print(f"\r⏱️  Recording: {remaining:.1f}s remaining - Keep speaking!    ", end="", flush=True)
-                    time.sleep(0.1)
-                else:
-                    print(f"\r⏰ Recording complete!                                        ")
-                    break
-
         try:
-            # Start countdown timer in background
-            timer_thread = threading.Thread(target=countdown_timer, daemon=True)
-            timer_thread.start()
-
             with self.microphone as source:
-                # Record for exactly 10 seconds, regardless of pauses
-                # This ensures we capture the complete speech
-                audio = self.recognizer.record(source, duration=record_seconds)
-
-            # Stop countdown and wait for timer thread to finish
-            listening = False
-            time.sleep(0.2)  # Give timer thread time to finish
+                # Record for exactly 10 seconds, regardless of pauses.
+                # Capture runs in ~1s slices so the on-device decoder (when
+                # present) can transcribe while the mic is still open.
+                audio, overlapped = self._record_command(source, record_seconds)
 
             print(f"\r🔄 Processing {record_seconds} seconds of audio... Please wait.              ")
 
+            # The incremental decoder may already have the answer
+            if overlapped:
+                print(f"\r✅ Whisper (local): '{overlapped}'                     ")
+                self.log(f"🎯 Whisper (local) recognized: '{overlapped}'", "green")
+                return overlapped
+
+            # Encode the WAV container here, once, and hand the bytes to
+            # the provider - the upload starts straight from this buffer
+            # instead of each recognizer re-encoding (or re-reading via a
+            # temp file) the same frames. The local path works from raw
+            # PCM and never needs the container.
+            wav_bytes = None
+            if self._local_whisper() is None:
+                wav_bytes = audio.get_wav_data()
+
             # Use the configured speech recognition service
-            return self.process_audio_with_service(audio)
+            return self.process_audio_with_service(audio, wav_bytes=wav_bytes)
 
         except Exception as e:
-            listening = False
-            time.sleep(0.2)  # Wait for timer thread
             print(f"\r❌ Recording error                                      ")
             self.log(f"❌ Recording error: {e}", "red")
             import traceback
             self.log(f"❌ Traceback: {traceback.format_exc()}", "red")
             return None
 
-    def process_audio_with_service(self, audio) -> Optional[str]:
-        """Process audio using the configured speech recognition service."""
+    def _record_command(self, source, record_seconds: int):
+        """Capture the command window in ~1s slices, decoding as it fills.
+
+        With the on-device pipeline already warm, a worker thread keeps
+        re-transcribing the accumulated buffer about once a second and
+        makes one final pass over the complete buffer when capture
+        stops, so most of the decode overlaps the recording and the
+        post-recording decode is skipped. A pipeline still loading is
+        left alone - the capture path never blocks on model startup.
+        Cloud services need the complete WAV, so without the local
+        pipeline capture behaves as before.
+
+        Returns (AudioData, completed transcript or None).
+        """
+        frames: List[bytes] = []
+        lock = threading.Lock()
+        done = threading.Event()
+        hypothesis: Dict = {}
+
+        def incremental_decode():
+            while True:
+                finished = done.wait(1.0)
+                with lock:
+                    covered = len(frames)
+                    buf = b''.join(frames)
+                if buf:
+                    text = self._transcribe_local_pcm(
+                        buf, source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+                    if text is None:
+                        return
+                    with lock:
+                        hypothesis['covered'] = covered
+                        hypothesis['text'] = text
+                # One last pass after capture ends so the hypothesis can
+                # cover every frame - that's what lets the caller skip
+                # the post-recording decode
+                if finished:
+                    return
+
+        # is_set(), not _local_whisper(): the latter waits on warmup and
+        # would stall the first mic read for the whole model load
+        worker = None
+        if (SPEECH_SERVICE == "whisper" and self._wm_ready.is_set()
+                and self._wm_batched is not None):
+            worker = threading.Thread(target=incremental_decode, daemon=True)
+            worker.start()
+
+        # Progress is painted from this loop - one print per second
+        # instead of a 100ms repaint thread fighting the capture for the
+        # GIL exactly when the stream needs servicing
+        per_second = max(1, source.SAMPLE_RATE // source.CHUNK)
+
+        # Trailing-silence stop: a short command ("jazz melody") ends the
+        # window after ~800ms under the calibrated energy threshold
+        # instead of padding out the full 10 seconds - less to record and
+        # less to decode. The 10s cap stays as the hard limit.
+        threshold = self.recognizer.energy_threshold
+        silence_needed = max(1, int(0.8 * per_second))
+        silent_run = 0
+        speech_seen = False
+
+        for i in range(per_second * record_seconds):
+            data = source.stream.read(source.CHUNK)
+            with lock:
+                frames.append(data)
+
+            if source.SAMPLE_WIDTH == 2:
+                samples = np.frombuffer(data, dtype=np.int16)
+                energy = np.sqrt(np.mean(samples.astype(np.float32) ** 2))
+                if energy > threshold:
+                    speech_seen = True
+                    silent_run = 0
+                else:
+                    silent_run += 1
+                    if speech_seen and silent_run >= silence_needed:
+                        print(f"\r⏰ Recording complete (end of speech)!                        ")
+                        break
+
+            if i % per_second == 0:
+                remaining = record_seconds - i // per_second
+                print(f"\r⏱️  Recording: {remaining}s remaining - Keep speaking!    ",
+                      end="", flush=True)
+        else:
+            print(f"\r⏰ Recording complete!                                        ")
+        done.set()
+        if worker is not None:
+            worker.join(timeout=5)
+
+        audio = sr.AudioData(b''.join(frames),
+                             source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+        final_text = None
+        with lock:
+            if hypothesis.get('covered') == len(frames):
+                final_text = hypothesis.get('text') or None
+        return audio, final_text
+
+    def _transcribe_local_pcm(self, pcm_bytes: bytes, sample_rate: int,
+                              sample_width: int) -> Optional[str]:
+        """Run the on-device pipeline over raw PCM; None when unavailable."""
+        pipeline = self._local_whisper()
+        if pipeline is None:
+            return None
         try:
-            if SPEECH_SERVICE == "whisper" and OPENAI_API_KEY:
-                return self.recognize_with_whisper(audio)
-            elif SPEECH_SERVICE == "deepgram" and DEEPGRAM_API_KEY:
-                return self.recognize_with_deepgram(audio)
-            elif SPEECH_SERVICE == "azure" and AZURE_SPEECH_KEY:
-                return self.recognize_with_azure(audio)
+            audio = sr.AudioData(pcm_bytes, sample_rate, sample_width)
+            # speech_recognition's own converter resamples to the 16kHz
+            # mono PCM the model expects; _to_f32 does the rest
+            pcm = audio.get_raw_data(convert_rate=16000, convert_width=2)
+            arr = _to_f32(pcm)
+            segments, _ = pipeline.transcribe(arr, batch_size=8, language="en")
+            return " ".join(seg.text.strip() for seg in segments).strip()
+        except Exception:
+            return None
+
+    def process_audio_with_service(self, audio, service: Optional[str] = None,
+                                   wav_bytes: Optional[bytes] = None) -> Optional[str]:
+        """Process audio using the given (or configured) speech recognition service.
+
+        Passing `service` explicitly keeps callers from having to mutate
+        the process-wide SPEECH_SERVICE setting, which isn't thread-safe.
+        Callers testing several services on one recording can encode it
+        once and pass `wav_bytes` so each provider doesn't re-run the WAV
+        encode on the same frames.
+        """
+        service = service or SPEECH_SERVICE
+
+        # Exact-repeat short circuit: identical PCM through the same
+        # service costs a digest instead of a decode
+        cache_key = (service,
+                     hashlib.blake2b(audio.frame_data, digest_size=16).digest())
+        cached = self._stt_cache.get(cache_key)
+        if cached is not None:
+            self._stt_cache.move_to_end(cache_key)
+            self.log(f"🎯 Recognized (cached): '{cached}'", "green")
+            return cached
+
+        try:
+            if service == "whisper" and self._local_whisper() is not None:
+                text = self.recognize_with_local_whisper(audio)
+            elif service == "whisper" and OPENAI_API_KEY:
+                text = self.recognize_with_whisper(audio, wav_bytes=wav_bytes)
+            elif service == "deepgram" and DEEPGRAM_API_KEY:
+                text = self.recognize_with_deepgram(audio, wav_bytes=wav_bytes)
+            elif service == "azure" and AZURE_SPEECH_KEY:
+                text = self.recognize_with_azure(audio)
             else:
                 # Fallback to Google (free)
-                return self.recognize_with_google(audio)
+                text = self.recognize_with_google(audio)
         except Exception as e:
             self.log(f"❌ Speech recognition error: {e}", "red")
             return None
 
+        if text:
+            self._stt_cache[cache_key] = text
+            if len(self._stt_cache) > 32:
+                self._stt_cache.popitem(last=False)
+        return text
+
     def recognize_with_google(self, audio) -> Optional[str]:
         """Use Google's free speech recognition."""
         try:
@@ -166,44 +415,91 @@ class VoiceToSunoJBL:
             self.log(f"❌ Google API error: {e}", "red")
             return None
 
-    def recognize_with_whisper(self, audio) -> Optional[str]:
-        """Use OpenAI Whisper API for superior accuracy."""
+    def _warmup_whisper(self):
+        """Load the on-device model and push one silent second through it.
+
+        Runs on a daemon thread during __init__; the first inference
+        triggers one-time allocation/compile work that would otherwise
+        land in the first session's critical path.
+        """
         try:
-            # Save audio to temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = temp_file.name
+            model = WhisperModel(WHISPER_MODEL, device=WHISPER_DEVICE,
+                                 compute_type=WHISPER_COMPUTE)
+            pipeline = BatchedInferencePipeline(model=model)
+            segments, _ = pipeline.transcribe(
+                np.zeros(16000, dtype=np.float32), batch_size=1, language="en")
+            list(segments)
+            self._wm_batched = pipeline
+        except Exception:
+            pass  # _local_whisper retries (and reports) on first real use
+        finally:
+            self._wm_ready.set()
 
-            # Convert audio to WAV format
-            with wave.open(temp_path, 'wb') as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(audio.sample_width)
-                wav_file.setframerate(audio.sample_rate)
-                wav_file.writeframes(audio.frame_data)
+    def _local_whisper(self):
+        """Return the shared on-device Whisper pipeline, or None.
+
+        Built once per process and reused across sessions; the batched
+        pipeline decodes an utterance in one CTranslate2 call instead of
+        segment-by-segment. Blocks briefly only if the startup warmup is
+        still running.
+        """
+        if WhisperModel is None:
+            return None
+        self._wm_ready.wait()
+        if self._wm_batched is None:
+            try:
+                model = WhisperModel(WHISPER_MODEL, device=WHISPER_DEVICE,
+                                     compute_type=WHISPER_COMPUTE)
+                self._wm_batched = BatchedInferencePipeline(model=model)
+            except Exception as e:
+                self.log(f"⚠️  Local Whisper unavailable: {e}", "yellow")
+                return None
+        return self._wm_batched
+
+    def recognize_with_local_whisper(self, audio) -> Optional[str]:
+        """Transcribe on-device with faster-whisper - no network round-trip."""
+        try:
+            text = self._transcribe_local_pcm(
+                audio.frame_data, audio.sample_rate, audio.sample_width)
+            if text:
+                print(f"\r✅ Whisper (local): '{text}'                         ")
+                self.log(f"🎯 Whisper (local) recognized: '{text}'", "green")
+                return text
+            print(f"\r❓ Whisper (local): Empty result                      ")
+            return None
+        except Exception as e:
+            print(f"\r❌ Whisper (local): Processing error                  ")
+            self.log(f"❌ Whisper (local) error: {e}", "red")
+            return None
+
+    def recognize_with_whisper(self, audio, wav_bytes: Optional[bytes] = None) -> Optional[str]:
+        """Use OpenAI Whisper API for superior accuracy."""
+        try:
+            if wav_bytes is None:
+                # Wrap the in-RAM frames in a WAV container directly -
+                # no tempfile write/reopen/unlink for data we already hold
+                wav_bytes = audio.get_wav_data()
 
             # Call OpenAI Whisper API
             headers = {
                 'Authorization': f'Bearer {OPENAI_API_KEY}'
             }
 
-            with open(temp_path, 'rb') as audio_file:
-                files = {
-                    'file': ('audio.wav', audio_file, 'audio/wav'),
-                    'model': (None, 'whisper-1'),
-                    'language': (None, 'en')
-                }
-
-                response = requests.post(
-                    'https://api.openai.com/v1/audio/transcriptions',
-                    headers=headers,
-                    files=files,
-                    timeout=30
-                )
+            files = {
+                'file': ('audio.wav', wav_bytes, 'audio/wav'),
+                'model': (None, 'whisper-1'),
+                'language': (None, 'en')
+            }
 
-            # Clean up temp file
-            os.unlink(temp_path)
+            response = self._stt_session.post(
+                'https://api.openai.com/v1/audio/transcriptions',
+                headers=headers,
+                files=files,
+                timeout=30
+            )
 
             if response.status_code == 200:
-                result = response.json()
+                result = json.loads(response.content)
                 text = result.get('text', '').strip()
                 if text:
                     print(f"\r✅ Whisper: '{text}'                                 ")
@@ -220,15 +516,9 @@ class VoiceToSunoJBL:
         except Exception as e:
             print(f"\r❌ Whisper: Processing error                           ")
             self.log(f"❌ Whisper error: {e}", "red")
-            # Clean up temp file if it exists
-            try:
-                if 'temp_path' in locals():
-                    os.unlink(temp_path)
-            except:
-                pass
             return None
 
-    def recognize_with_deepgram(self, audio) -> Optional[str]:
+    def recognize_with_deepgram(self, audio, wav_bytes: Optional[bytes] = None) -> Optional[str]:
         """Use Deepgram API for high accuracy."""
         try:
             headers = {
@@ -236,10 +526,10 @@ class VoiceToSunoJBL:
                 'Content-Type': 'audio/wav'
             }
 
-            # Convert audio to bytes
-            audio_data = audio.get_wav_data()
+            # Convert audio to bytes (unless the caller already did)
+            audio_data = wav_bytes if wav_bytes is not None else audio.get_wav_data()
 
-            response = requests.post(
+            response = self._stt_session.post(
                 'https://api.deepgram.com/v1/listen?model=nova-2&smart_format=true',
                 headers=headers,
                 data=audio_data,
@@ -247,7 +537,7 @@ class VoiceToSunoJBL:
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = json.loads(response.content)
                 transcript = result.get('results', {}).get('channels', [{}])[0].get('alternatives', [{}])[0].get('transcript', '').strip()
                 if transcript:
                     print(f"\r✅ Deepgram: '{transcript}'                          ")
@@ -279,8 +569,15 @@ class VoiceToSunoJBL:
 
     def generate_music(self, prompt: str) -> Optional[str]:
         """Generate music with Suno API."""
+        match = _SENSITIVE_RE.search(prompt)
+        if match:
+            # Warn-only: "kill the lights" is a fine prompt. Suno's own
+            # filter decides via SENSITIVE_WORD_ERROR in wait_for_music.
+            self.log(f"⚠️  Prompt contains '{match.group(0)}' - Suno's filter "
+                     "may reject it", "yellow")
+
         self.log(f"🎵 Generating music: '{prompt}'", "magenta")
-        
+
         payload = {
             "prompt": prompt,
             "customMode": False,
@@ -293,7 +590,7 @@ class VoiceToSunoJBL:
             response = self.session.post(f"{BASE_URL}/api/v1/generate", json=payload, timeout=30)
             response.raise_for_status()
             
-            result = response.json()
+            result = json.loads(response.content)
             if result.get('code') == 200:
                 task_id = result.get('data', {}).get('taskId')
                 self.log(f"✅ Generation started! Task ID: {task_id}", "green")
@@ -309,20 +606,34 @@ class VoiceToSunoJBL:
     def wait_for_music(self, task_id: str) -> List[Dict]:
         """Wait for music generation and return track data."""
         self.log("⏳ Waiting for your music to be generated...", "yellow")
-        
-        max_attempts = 24  # 6 minutes total
-        for attempt in range(1, max_attempts + 1):
-            time.sleep(15)
-            self.log(f"📡 Checking progress... ({attempt * 15}s elapsed)", "cyan")
-            
+
+        # Exponential backoff: fast tasks get caught within seconds, slow
+        # ones settle into the old 15s cadence. 6 minute budget overall.
+        deadline = time.monotonic() + 360
+        delay = 2.0
+        start = time.monotonic()
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 15)
+            if self.verbose:
+                self.log(f"📡 Checking progress... ({time.monotonic() - start:.0f}s elapsed)", "cyan")
+
             try:
                 response = self.session.get(
                     f"{BASE_URL}/api/v1/generate/record-info?taskId={task_id}",
                     timeout=30
                 )
                 response.raise_for_status()
-                
-                result = response.json()
+
+                # blake2b is fast and non-cryptographic use is fine here -
+                # it only detects "same body as last poll"
+                digest = hashlib.blake2b(response.content, digest_size=8).digest()
+                cached = self._status_cache.get(task_id)
+                if cached and cached[0] == digest:
+                    result = cached[1]
+                else:
+                    result = json.loads(response.content)
+                    self._status_cache[task_id] = (digest, result)
                 if result.get('code') == 200:
                     data = result.get('data', {})
 
@@ -330,16 +641,19 @@ class VoiceToSunoJBL:
                     status = data.get('status')
                     if status == 'SENSITIVE_WORD_ERROR':
                         self.log(f"❌ Sensitive word error: {data.get('errorMessage', 'Please rephrase your prompt')}", "red")
+                        self._status_cache.pop(task_id, None)
                         return []
                     elif status == 'FAILED':
                         self.log(f"❌ Generation failed: {data.get('errorMessage', 'Unknown error')}", "red")
+                        self._status_cache.pop(task_id, None)
                         return []
 
                     # Handle response data safely
                     response_data = data.get('response')
                     if response_data is None:
                         # Still pending
-                        self.log(f"⏳ Status: {status or 'PENDING'}", "yellow")
+                        if self.verbose:
+                            self.log(f"⏳ Status: {status or 'PENDING'}", "yellow")
                         continue
 
                     # Get suno data safely
@@ -365,15 +679,14 @@ class VoiceToSunoJBL:
 
                     if ready_tracks:
                         self.log(f"🎉 Music ready! Generated {len(ready_tracks)} track(s)", "green")
+                        self._status_cache.pop(task_id, None)
                         return ready_tracks
                 
             except Exception as e:
                 self.log(f"⚠️  Status check failed: {e}", "yellow")
-            
-            if attempt == max_attempts:
-                self.log("⚠️  Generation timeout - music might still be processing", "yellow")
-                break
-        
+
+        self.log("⚠️  Generation timeout - music might still be processing", "yellow")
+        self._status_cache.pop(task_id, None)
         return []
     
     def set_jbl_as_default(self):
@@ -387,39 +700,201 @@ class VoiceToSunoJBL:
             self.log(f"⚠️  Could not set JBL as default: {e}", "yellow")
             return False
     
+    def _jbl_ready(self) -> bool:
+        """Check the JBL sink is reachable without making a sound.
+
+        A pactl sink listing replaces the old paplay test tone: no fork
+        of the full audio pipeline, no ~0.5s beep out of the speaker.
+        Any listed state counts as ready - a SUSPENDED sink wakes on
+        playback just as it did for the test tone. Cached for 5 seconds
+        so back-to-back tracks don't re-run pactl.
+        """
+        now = time.monotonic()
+        if now - self._jbl_last_check < 5:
+            return self._jbl_last_ok
+
+        ok = False
+        try:
+            result = subprocess.run(['pactl', 'list', 'short', 'sinks'],
+                                    capture_output=True, text=True, timeout=5)
+            for line in result.stdout.splitlines():
+                fields = line.split()
+                if len(fields) >= 2 and fields[1] == JBL_DEVICE:
+                    ok = True
+                    break
+        except Exception:
+            ok = False
+
+        self._jbl_last_check = now
+        self._jbl_last_ok = ok
+        return ok
+
+    def _start_prefetch(self, track: Dict):
+        """Begin downloading a track's audio in the background."""
+        key = track.get('id') or track['stream_url']
+        if key not in self._prefetch_futures:
+            self._prefetch_futures[key] = self._prefetch_pool.submit(
+                self._download_to_tmp, track['stream_url'])
+
+    def _download_to_tmp(self, url: str) -> str:
+        """Stream a track to a temp file and return its path."""
+        # Plain requests.get - the CDN shouldn't see the Suno API key
+        # that lives on self.session
+        with requests.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp:
+                for chunk in response.iter_content(65536):
+                    tmp.write(chunk)
+                return tmp.name
+
+    def _prefetched_path(self, track: Dict) -> Optional[str]:
+        """Local path for a finished prefetch, else None (play the URL)."""
+        future = self._prefetch_futures.get(track.get('id') or track['stream_url'])
+        if future is not None and future.done() and future.exception() is None:
+            return future.result()
+        return None
+
+    def _ensure_mpv(self):
+        """Spawn the idle mpv process and connect its IPC socket (lazily)."""
+        if (self._mpv_proc is not None and self._mpv_proc.poll() is None
+                and self._mpv_sock is not None):
+            return self._mpv_sock
+
+        self._shutdown_mpv()
+        try:
+            self._mpv_proc = subprocess.Popen(
+                ['mpv', '--idle',
+                 f'--input-ipc-server={MPV_IPC_SOCKET}',
+                 f'--audio-device=pulse/{JBL_DEVICE}',
+                 '--no-video',
+                 '--volume=80',
+                 # Small buffers: mpv's default ~10s demuxer cache delays
+                 # first audio out of the speaker by the same amount
+                 '--cache=yes',
+                 '--cache-secs=2',
+                 '--demuxer-readahead-secs=2',
+                 '--network-timeout=5',
+                 '--stream-buffer-size=512k',
+                 '--audio-buffer=0.1',
+                 '--gapless-audio=yes',
+                 '--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+            # The socket appears shortly after mpv starts
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                try:
+                    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    sock.connect(MPV_IPC_SOCKET)
+                    self._mpv_sock = sock
+                    return sock
+                except OSError:
+                    time.sleep(0.1)
+        except Exception as e:
+            self.log(f"⚠️  Persistent mpv unavailable: {e}", "yellow")
+
+        self._shutdown_mpv()
+        return None
+
+    def _shutdown_mpv(self):
+        """Tear down the persistent player, if any."""
+        if self._mpv_sock is not None:
+            try:
+                self._mpv_sock.sendall(b'{"command":["quit"]}\n')
+            except OSError:
+                pass
+            try:
+                self._mpv_sock.close()
+            except OSError:
+                pass
+            self._mpv_sock = None
+        if self._mpv_proc is not None:
+            if self._mpv_proc.poll() is None:
+                self._mpv_proc.terminate()
+            self._mpv_proc = None
+
+    def _play_via_ipc(self, stream_url: str) -> bool:
+        """Play one track on the persistent mpv, waiting for end-file."""
+        sock = self._ensure_mpv()
+        if sock is None:
+            return False
+
+        payload = json.dumps({"command": ["loadfile", stream_url, "replace"]})
+        sock.sendall(payload.encode() + b'\n')
+        sock.settimeout(300)  # same 5 minute cap as the one-shot path
+
+        buf = b''
+        while True:
+            data = sock.recv(4096)
+            if not data:
+                # mpv went away mid-track; force a respawn next time
+                self._shutdown_mpv()
+                return False
+            buf += data
+            while b'\n' in buf:
+                line, buf = buf.split(b'\n', 1)
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if event.get('event') == 'end-file':
+                    return event.get('reason') != 'error'
+
     def play_on_jbl(self, track: Dict) -> bool:
         """Play music directly on JBL speaker."""
         title = track['title']
-        stream_url = track['stream_url']
+        # A completed prefetch plays from local disk; otherwise stream
+        stream_url = self._prefetched_path(track) or track['stream_url']
 
         self.log(f"🎵 Playing on JBL: {title}", "magenta")
         self.log(f"🔗 Stream URL: {stream_url[:50]}...", "cyan")
 
         # Test JBL connection first
         self.log("🔊 Testing JBL connection...", "cyan")
-        try:
-            subprocess.run(['paplay', '/usr/share/sounds/alsa/Front_Right.wav',
-                          f'--device={JBL_DEVICE}'],
-                         check=True, capture_output=True, timeout=5)
+        if self._jbl_ready():
             self.log("✅ JBL connection verified", "green")
-        except Exception as e:
-            self.log(f"⚠️  JBL connection issue: {e}", "yellow")
+        else:
+            self.log("⚠️  JBL sink not listed by PulseAudio", "yellow")
             # Try to reconnect
             self.set_jbl_as_default()
 
+        # Preferred path: hand the URL to the persistent mpv over IPC -
+        # no per-track process spawn, codec init or sink re-open, so
+        # back-to-back tracks start instantly
         try:
-            # Use mpv with specific audio device
+            self.log("🔊 Starting playback on JBL Flip Essentials...", "green")
+            if self._play_via_ipc(stream_url):
+                self.log("✅ Playback completed successfully", "green")
+                return True
+            self.log("⚠️  Persistent player failed, falling back to one-shot mpv", "yellow")
+        except socket.timeout:
+            self.log("⏰ Playback timeout (5 minutes)", "yellow")
+            self._shutdown_mpv()
+            return True
+        except KeyboardInterrupt:
+            self.log("\n⏸️  Playback stopped by user", "yellow")
+            self._shutdown_mpv()
+            return True
+        except Exception as e:
+            self.log(f"⚠️  IPC playback error: {e}", "yellow")
+            self._shutdown_mpv()
+
+        try:
+            # Fallback: one mpv process for this track
             cmd = [
                 'mpv', stream_url,
                 f'--audio-device=pulse/{JBL_DEVICE}',
                 f'--title=JBL: {title}',
                 '--no-video',
                 '--volume=80',
-                '--osd-level=1',
+                '--cache=yes',
+                '--cache-secs=2',
+                '--demuxer-readahead-secs=2',
+                '--network-timeout=5',
+                '--stream-buffer-size=512k',
+                '--audio-buffer=0.1',
                 '--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
             ]
 
-            self.log("🔊 Starting playback on JBL Flip Essentials...", "green")
             self.log("🎮 Press 'q' to stop, SPACE to pause/play", "cyan")
 
             result = subprocess.run(cmd, timeout=300)  # 5 minute timeout
@@ -449,11 +924,34 @@ class VoiceToSunoJBL:
             except:
                 return False
     
+    def _prepare_tts(self):
+        """Pre-synthesize the canned status lines to WAV (best effort)."""
+        for message in _CANNED_STATUS:
+            digest = hashlib.blake2b(message.encode(), digest_size=8).hexdigest()
+            path = f"/tmp/tts_{digest}.wav"
+            try:
+                if not os.path.exists(path):
+                    subprocess.run(['espeak', '-w', path, message],
+                                   capture_output=True, timeout=5, check=True)
+                self._tts[message] = path
+            except Exception:
+                pass  # TTS is optional
+
     def speak_status(self, message: str):
         """Use text-to-speech to announce status (optional)."""
+        path = self._tts.get(message)
+        if path:
+            try:
+                # Fire-and-forget replay of the pre-synthesized line
+                subprocess.Popen(['paplay', path],
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
+                return
+            except Exception:
+                pass
         try:
-            # Use espeak if available for status announcements
-            subprocess.run(['espeak', message], 
+            # Unseen strings still synthesize on the spot
+            subprocess.run(['espeak', message],
                          capture_output=True, timeout=5)
         except:
             pass  # TTS is optional
@@ -471,20 +969,31 @@ class VoiceToSunoJBL:
             self.speak_status("Music generation failed")
             return False
         
-        # Step 3: Set JBL as output
-        self.set_jbl_as_default()
-        
+        # Steps 3+4 overlap: selecting the JBL sink and pre-spawning the
+        # persistent player cost a few hundred ms of pactl and process
+        # setup that hides entirely behind the 30-120s generation wait
+        def prepare_output():
+            self.set_jbl_as_default()
+            self._ensure_mpv()
+
+        output_thread = threading.Thread(target=prepare_output, daemon=True)
+        output_thread.start()
+
         # Step 4: Wait for music
         self.speak_status("Generating your music, please wait")
         tracks = self.wait_for_music(task_id)
+        output_thread.join(timeout=10)
         
         if not tracks:
             self.speak_status("Music generation timed out")
             return False
         
-        # Step 5: Play on JBL
+        # Step 5: Play on JBL, warming up the next track while the
+        # current one plays
         self.speak_status("Your music is ready")
-        for track in tracks:
+        for i, track in enumerate(tracks):
+            if i + 1 < len(tracks):
+                self._start_prefetch(tracks[i + 1])
             if not self.play_on_jbl(track):
                 break
         
@@ -523,17 +1032,24 @@ class VoiceToSunoJBL:
 def main():
     """Main entry point."""
     try:
+        # Kick off the sink scan in the background and build the app
+        # meanwhile - __init__ covers mic calibration and (when local
+        # Whisper is in play) the model warmup, so the pactl run costs
+        # no wall time of its own
+        sinks_future = ThreadPoolExecutor(max_workers=1).submit(
+            subprocess.run, ['pactl', 'list', 'short', 'sinks'],
+            capture_output=True, text=True)
+
+        # Initialize and run
+        app = VoiceToSunoJBL()
+
         # Check if JBL is connected
-        result = subprocess.run(['pactl', 'list', 'short', 'sinks'], 
-                              capture_output=True, text=True)
+        result = sinks_future.result(timeout=10)
         if JBL_DEVICE not in result.stdout:
             print("❌ JBL Flip Essentials not found!")
             print("💡 Make sure your JBL speaker is paired and connected")
             sys.exit(1)
         
-        # Initialize and run
-        app = VoiceToSunoJBL()
-        
         # Check command line arguments
         if len(sys.argv) > 1 and sys.argv[1] == "--single":
             # Single session mode
@@ -1,23 +1,34 @@
 #!/usr/bin/env python3
 """Working Suno POC using direct API calls."""
 
-import urllib.request
-import urllib.parse
+import urllib3
+import functools
 import json
 import os
+import re
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+# One keep-alive pool for every request in the process: repeat hits to
+# the same host reuse the TLS connection instead of handshaking again
+_POOL = urllib3.PoolManager(maxsize=4, retries=urllib3.Retry(2))
+
+_COOKIE_RE = re.compile(rb'^SUNO_COOKIE=(.*)$', re.M)
+
+@functools.lru_cache(maxsize=1)
 def load_cookie():
-    """Load cookie from .env file."""
-    env_file = ".env"
-    if os.path.exists(env_file):
-        with open(env_file, 'r') as f:
-            content = f.read()
-            for line in content.split('\n'):
-                if line.startswith('SUNO_COOKIE='):
-                    return line.split('=', 1)[1].strip()
-    return None
+    """Load cookie from .env file.
+
+    One read, one regex scan, cached for the rest of the process - no
+    re-reading the file on later calls.
+    """
+    try:
+        content = open(".env", 'rb').read()
+    except OSError:
+        return None
+    match = _COOKIE_RE.search(content)
+    return match.group(1).decode().strip() if match else None
 
 def make_request(url, method='GET', data=None, cookie=None):
     """Make HTTP request with proper headers."""
@@ -31,28 +42,27 @@ def make_request(url, method='GET', data=None, cookie=None):
     
     if cookie:
         headers['Cookie'] = cookie
-    
+
+    body = None
     if data:
         headers['Content-Type'] = 'application/json'
-        data = json.dumps(data).encode('utf-8')
-    
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
-    
+        body = json.dumps(data).encode('utf-8')
+
     try:
-        with urllib.request.urlopen(req, timeout=30) as response:
-            response_data = response.read().decode('utf-8')
+        response = _POOL.request(method, url, body=body, headers=headers,
+                                 timeout=5)
+        response_data = response.data.decode('utf-8')
+        if response.status < 400:
             return {
-                'status_code': response.getcode(),
+                'status_code': response.status,
                 'data': json.loads(response_data) if response_data else None,
                 'success': True
             }
-    except urllib.error.HTTPError as e:
-        error_data = e.read().decode('utf-8') if e.fp else str(e)
         return {
-            'status_code': e.code,
-            'data': error_data,
+            'status_code': response.status,
+            'data': response_data,
             'success': False,
-            'error': str(e)
+            'error': f'HTTP Error {response.status}'
         }
     except Exception as e:
         return {
@@ -73,22 +83,30 @@ def test_suno_endpoints(cookie):
         "https://app.suno.ai/api/feed/",
     ]
     
-    for endpoint in endpoints:
-        print(f"\n📡 Testing: {endpoint}")
-        result = make_request(endpoint, cookie=cookie)
-        
-        print(f"Status: {result['status_code']}")
-        if result['success']:
-            print("✅ Success!")
-            if result['data']:
-                print(f"Response keys: {list(result['data'].keys()) if isinstance(result['data'], dict) else 'Not a dict'}")
-                return endpoint
-        else:
-            print(f"❌ Failed: {result.get('error', 'Unknown error')}")
-            if result['data']:
-                print(f"Response: {str(result['data'])[:200]}...")
-    
-    return None
+    # All probes fly at once - wall time is the slowest endpoint, not
+    # the sum of every timeout in sequence
+    working = None
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = {executor.submit(make_request, url, cookie=cookie): url
+                   for url in endpoints}
+        for future in as_completed(futures):
+            endpoint = futures[future]
+            result = future.result()
+
+            print(f"\n📡 Tested: {endpoint}")
+            print(f"Status: {result['status_code']}")
+            if result['success']:
+                print("✅ Success!")
+                if result['data']:
+                    print(f"Response keys: {list(result['data'].keys()) if isinstance(result['data'], dict) else 'Not a dict'}")
+                    if working is None:
+                        working = endpoint
+            else:
+                print(f"❌ Failed: {result.get('error', 'Unknown error')}")
+                if result['data']:
+                    print(f"Response: {str(result['data'])[:200]}...")
+
+    return working
 
 def generate_music_simple(cookie, prompt):
     """Try to generate music using simple approach."""
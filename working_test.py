@@ -1,130 +1,351 @@
 #!/usr/bin/env python3
 """Working test that successfully generates music."""
 
-import urllib.request
+import functools
+import hashlib
 import json
+import logging
+import os
+import random
+import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
-# Configuration
-API_KEY = "4e2feeb494648a5f5845dd5b65558544"
+import requests
+from requests.adapters import HTTPAdapter
+
+# orjson parses/serializes bytes directly in C - no intermediate UTF-8
+# decode pass on the hot response path. Stdlib json is the fallback.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps_bytes = orjson.dumps
+except ImportError:
+    orjson = None
+    _loads = json.loads
+    _dumps_bytes = lambda obj: json.dumps(obj).encode('utf-8')
+
+# Lazy %s interpolation: disabled levels never format their arguments,
+# so poll-loop chatter costs nothing under LOGLEVEL=WARNING
+log = logging.getLogger(__name__)
+
+# Configuration - SUNO_API_KEY overrides the checked-in test key. The
+# Bearer header is composed once here and lives on the session, so no
+# call rebuilds it.
+API_KEY = os.environ.get("SUNO_API_KEY", "4e2feeb494648a5f5845dd5b65558544")
+_AUTH_HEADER = f'Bearer {API_KEY}'
 BASE_URL = "https://apibox.erweima.ai"
 
+# Webhook mode: point SUNO_CALLBACK_URL at a public tunnel (e.g. ngrok)
+# forwarding to SUNO_CALLBACK_PORT and the provider pushes completion to
+# us - zero polling round-trips. Without it we fall back to polling.
+CALLBACK_URL = os.environ.get("SUNO_CALLBACK_URL")
+CALLBACK_PORT = int(os.environ.get("SUNO_CALLBACK_PORT", "8765"))
+
+_CALLBACK_EVENT = threading.Event()
+_CALLBACK_RESULT = {}
+
+
+class _CallbackHandler(BaseHTTPRequestHandler):
+    """Receives the provider's completion POST and wakes main()."""
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            _CALLBACK_RESULT['payload'] = json.loads(self.rfile.read(length))
+        except (ValueError, OSError):
+            _CALLBACK_RESULT['payload'] = None
+        self.send_response(200)
+        self.end_headers()
+        _CALLBACK_EVENT.set()
+
+    def log_message(self, format, *args):
+        pass  # keep request noise out of the test output
+
+
+def _start_callback_server():
+    """Start the callback listener in a daemon thread."""
+    server = ThreadingHTTPServer(('', CALLBACK_PORT), _CallbackHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# Pin DNS for the process: the script talks to one API host for a few
+# minutes at most, so every reconnect after an idle drop or pool miss
+# can skip the getaddrinfo round-trip. Acceptable only because the
+# process is short-lived relative to any sane record TTL.
+socket.getaddrinfo = functools.lru_cache(maxsize=16)(socket.getaddrinfo)
+
+class _TunedAdapter(HTTPAdapter):
+    """HTTPAdapter with latency-oriented socket options.
+
+    TCP_NODELAY sends the small JSON requests immediately instead of
+    letting Nagle hold them for coalescing; SO_KEEPALIVE keeps idle
+    pooled connections from being silently dropped between backoff
+    sleeps.
+    """
+
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+# One session for the whole script: the POST and every status poll hit
+# the same host, so keep-alive reuses one TLS connection instead of
+# handshaking per request
+# Only advertise brotli when the decoder is importable - offering an
+# encoding we cannot decompress would corrupt every response
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+SESSION = requests.Session()
+SESSION.mount('https://', _TunedAdapter(pool_connections=2, pool_maxsize=10))
+SESSION.headers.update({
+    'Content-Type': 'application/json',
+    'Authorization': _AUTH_HEADER,
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'User-Agent': 'SunoTest/1.0'
+})
+
+# Hoisted request constants: only the prompt varies between calls, so
+# the URLs and the static payload fields are built once at import
+_GEN_URL = f"{BASE_URL}/api/v1/generate"
+_STATUS_URL = f"{BASE_URL}/api/v1/generate/record-info"
+_PAYLOAD_BASE = {
+    "customMode": False,
+    "instrumental": False,
+    "model": "V3_5",
+    "callBackUrl": CALLBACK_URL or "https://httpbin.org/post"
+}
+
 def generate_music(prompt="rock music"):
     """Generate music and return task ID."""
-    print(f"🎵 Generating music with prompt: '{prompt}'")
-    print(f"💰 Using V3_5 model (cheaper option)")
-    
-    url = f"{BASE_URL}/api/v1/generate"
-    
-    payload = {
-        "prompt": prompt,
-        "customMode": False,
-        "instrumental": False,
-        "model": "V3_5",
-        "callBackUrl": "https://httpbin.org/post"
-    }
-    
-    headers = {
-        'Content-Type': 'application/json',
-        'Authorization': f'Bearer {API_KEY}',
-        'User-Agent': 'SunoTest/1.0'
-    }
-    
+    log.info("🎵 Generating music with prompt: '%s'", prompt)
+    log.info("💰 Using V3_5 model (cheaper option)")
+
+    payload = {**_PAYLOAD_BASE, "prompt": prompt}
+
     try:
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(url, data=data, headers=headers, method='POST')
-        
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode('utf-8'))
-            
-            if result.get('code') == 200:
-                task_id = result.get('data', {}).get('taskId')
-                print(f"✅ Success! Task ID: {task_id}")
-                return task_id
-            else:
-                print(f"❌ Error: {result.get('msg')}")
-                return None
-                
-    except Exception as e:
-        print(f"❌ Request failed: {e}")
+        response = SESSION.post(_GEN_URL, data=_dumps_bytes(payload), timeout=30)
+        result = _loads(response.content)
+
+        if result.get('code') == 200:
+            task_id = result.get('data', {}).get('taskId')
+            log.info("✅ Success! Task ID: %s", task_id)
+            return task_id
+        else:
+            log.info("❌ Error: %s", result.get('msg'))
+            return None
+
+    except (requests.Timeout, requests.ConnectionError, ValueError) as e:
+        # Expected transient failures: log name + message, no traceback
+        log.info("❌ Request failed: %s: %s", e.__class__.__name__, e)
         return None
 
+# Last response per task: (body digest, parsed data). Polls that return
+# a byte-identical body reuse the parsed object instead of re-parsing.
+_STATUS_CACHE = {}
+
 def check_status(task_id):
     """Check the status of a music generation task."""
-    print(f"🔍 Checking status for task: {task_id}")
+    log.debug("🔍 Checking status for task: %s", task_id)
 
-    # Correct endpoint from documentation
-    url = f"{BASE_URL}/api/v1/generate/record-info?taskId={task_id}"
+    try:
+        response = SESSION.get(_STATUS_URL, params={'taskId': task_id},
+                               timeout=30)
+        raw = response.content
+        digest = hashlib.blake2b(raw, digest_size=8).digest()
+        cached = _STATUS_CACHE.get(task_id)
+        if cached and cached[0] == digest:
+            return cached[1]
+        result = _loads(raw)
+
+        if result.get('code') == 200:
+            data = result.get('data')
+            _STATUS_CACHE[task_id] = (digest, data)
+            return data
+        else:
+            log.info("❌ Status check error: %s", result.get('msg'))
+            return None
 
-    headers = {
-        'Authorization': f'Bearer {API_KEY}',
-        'User-Agent': 'SunoTest/1.0'
-    }
+    except (requests.Timeout, requests.ConnectionError, ValueError) as e:
+        # Retried by the backoff loop - a class name and message is all
+        # the caller needs, not a formatted frame stack per poll
+        log.info("❌ Status check failed: %s: %s", e.__class__.__name__, e)
+        return None
 
+def generate_many(prompts):
+    """Submit several prompts concurrently over the shared pool.
+
+    Round-trips overlap instead of queueing, so wall time is the
+    slowest submission rather than the sum. Returns task IDs in
+    prompt order (None where submission failed).
+    """
+    with ThreadPoolExecutor(max_workers=min(len(prompts), 10)) as pool:
+        return list(pool.map(generate_music, prompts))
+
+def generate_batch(prompts):
+    """Submit several prompts in one request when the API allows it.
+
+    A prompts array costs one round-trip for the whole batch; if the
+    endpoint rejects that shape, fall back to concurrent single-prompt
+    submissions over the shared pool. Returns a list of task IDs.
+    """
+    payload = {**_PAYLOAD_BASE, "prompts": list(prompts)}
     try:
-        req = urllib.request.Request(url, headers=headers, method='GET')
+        response = SESSION.post(_GEN_URL, data=_dumps_bytes(payload),
+                                timeout=30)
+        result = _loads(response.content)
+        if result.get('code') == 200:
+            data = result.get('data') or {}
+            task_ids = data.get('taskIds') or [data.get('taskId')]
+            if any(task_ids):
+                log.info("✅ Batch accepted: %d task(s)", len(task_ids))
+                return task_ids
+    except (requests.Timeout, requests.ConnectionError, ValueError) as e:
+        log.info("❌ Batch request failed: %s: %s", e.__class__.__name__, e)
+    log.info("↩️ Batch shape not accepted - submitting prompts concurrently")
+    return generate_many(prompts)
 
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode('utf-8'))
+def check_status_many(task_ids):
+    """Poll several tasks concurrently; returns {task_id: data}."""
+    with ThreadPoolExecutor(max_workers=min(len(task_ids), 10)) as pool:
+        return dict(zip(task_ids, pool.map(check_status, task_ids)))
 
-            if result.get('code') == 200:
-                return result.get('data')
-            else:
-                print(f"❌ Status check error: {result.get('msg')}")
-                return None
+def _first_audio_url(status_data):
+    """Single pass over the status payload; first audio_url or None.
 
-    except Exception as e:
-        print(f"❌ Status check failed: {e}")
+    Normalizing the lone-dict shape into a one-element sequence keeps
+    one loop serving both response forms - no branch-per-shape rewalk
+    on every poll.
+    """
+    if isinstance(status_data, dict):
+        status_data = (status_data,)
+    elif not isinstance(status_data, (list, tuple)):
         return None
+    for track in status_data:
+        url = track.get('audio_url')
+        if url:
+            return url
+    return None
+
+def _audio_ready(status_data):
+    """True as soon as a ready track URL is found."""
+    audio_url = _first_audio_url(status_data)
+    if audio_url:
+        log.info("🎵 Music ready: %s", audio_url)
+        return True
+    return False
+
+def _poll_until_ready(task_id, timeout=180, cancel=None):
+    """Poll a task with exponential backoff until audio is ready.
+
+    Runs happily on a worker thread; sleeping on the ``cancel`` event
+    instead of time.sleep means an externally set cancel (or Ctrl-C in
+    the caller) interrupts a wait immediately rather than after up to
+    30 seconds. Returns True once a track is ready, False on timeout
+    or cancellation.
+    """
+    # Fast jobs are caught within seconds, slow jobs are not hammered
+    # every 10s, and total wait is bounded by time rather than attempts
+    if cancel is None:
+        cancel = threading.Event()
+    # Bind loop dependencies to locals once - LOAD_FAST in the loop
+    # body instead of a global+attribute lookup per iteration
+    _check, _dumps, _now = check_status, json.dumps, time.monotonic
+    deadline = _now() + timeout
+    delay = 2.0
+    attempt = 0
+    while _now() < deadline and not cancel.is_set():
+        attempt += 1
+        log.debug("\n📡 Status check #%d", attempt)
+        status_data = _check(task_id)
+
+        if status_data:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("📄 Status response:")
+                log.debug(_dumps(status_data, indent=2))
+
+            if _audio_ready(status_data):
+                return True
+
+            if isinstance(status_data, dict):
+                # Honor the API's own ETA when it offers one
+                eta = status_data.get('estimated_remaining_seconds')
+                if eta:
+                    delay = min(delay, float(eta))
+
+        wait = min(delay + random.uniform(0, 0.5), 30,
+                   max(deadline - _now(), 0))
+        if wait <= 0:
+            break
+        log.debug("⏳ Still generating... waiting %.1f seconds", wait)
+        if cancel.wait(wait):
+            break
+        delay *= 2
+    return False
 
 def main():
     """Main test function."""
-    print("🎵 Suno API Working Test")
-    print("=" * 40)
+    logging.basicConfig(level=os.environ.get('LOGLEVEL', 'INFO'),
+                        format='%(message)s')
+    log.info("🎵 Suno API Working Test")
+    log.info("=" * 40)
     
     # Generate music
     task_id = generate_music("upbeat rock song")
     
     if not task_id:
-        print("❌ Generation failed")
+        log.info("❌ Generation failed")
         return
     
-    print(f"\n⏳ Waiting for music generation...")
-    print(f"🆔 Task ID: {task_id}")
-    
-    # Check status a few times
-    for attempt in range(5):
-        print(f"\n📡 Status check #{attempt + 1}")
-        status_data = check_status(task_id)
-        
-        if status_data:
-            print(f"📄 Status response:")
-            print(json.dumps(status_data, indent=2))
-            
-            # Check if we have audio URLs
-            if isinstance(status_data, list) and len(status_data) > 0:
-                for i, track in enumerate(status_data):
-                    audio_url = track.get('audio_url')
-                    if audio_url:
-                        print(f"🎵 Track {i+1} ready: {audio_url}")
-                        return True
-            elif isinstance(status_data, dict):
-                audio_url = status_data.get('audio_url')
-                if audio_url:
-                    print(f"🎵 Music ready: {audio_url}")
-                    return True
-        
-        if attempt < 4:  # Don't wait after the last attempt
-            print("⏳ Still generating... waiting 10 seconds")
-            time.sleep(10)
-    
-    print(f"\n⚠️ Music generation may still be in progress")
-    print(f"🆔 Save this task ID to check later: {task_id}")
+    log.info("\n⏳ Waiting for music generation...")
+    log.info("🆔 Task ID: %s", task_id)
+
+    # Prefer the push path: the provider POSTs to us the moment the job
+    # finishes, so latency-to-ready is ~0 and we skip every poll
+    if CALLBACK_URL:
+        server = _start_callback_server()
+        log.info("📬 Waiting for callback at %s (port %s)...", CALLBACK_URL, CALLBACK_PORT)
+        got_callback = _CALLBACK_EVENT.wait(timeout=180)
+        server.shutdown()
+        if got_callback:
+            payload = _CALLBACK_RESULT.get('payload') or {}
+            log.info("📄 Callback payload:")
+            log.info(json.dumps(payload, indent=2))
+            if _audio_ready(payload.get('data')):
+                return True
+        log.info("⚠️ No usable callback - falling back to status polling")
+
+    # Poll on a worker thread: the main thread only blocks in
+    # future.result(), so Ctrl-C lands immediately and the cancel event
+    # stops the worker mid-wait instead of after a full backoff sleep
+    cancel = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(_poll_until_ready, task_id, 180, cancel)
+        try:
+            if future.result():
+                return True
+        except KeyboardInterrupt:
+            cancel.set()
+            raise
+
+    log.info("\n⚠️ Music generation may still be in progress")
+    log.info("🆔 Save this task ID to check later: %s", task_id)
     return True
 
 if __name__ == "__main__":
     try:
-        main()
+        with SESSION:  # close pooled connections cleanly on exit
+            main()
     except KeyboardInterrupt:
         print("\n👋 Test interrupted")
     except Exception as e: